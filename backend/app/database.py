@@ -4,52 +4,191 @@ Database configuration and session management for Email Campaign App.
 Supports both SQLite (development) and PostgreSQL (production) databases.
 """
 
+import importlib.util
+import logging
 import os
-from typing import Generator
-from sqlalchemy import create_engine, MetaData, text
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional
+from sqlalchemy import create_engine, event, inspect, MetaData, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./email_campaigns.db")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
-# Create SQLAlchemy engine
-if DATABASE_URL.startswith("sqlite"):
+
+def _normalize_postgres_url(url: str) -> str:
+    """
+    Pick the PostgreSQL driver for a bare postgres:// or postgresql:// URL.
+    
+    Prefers psycopg 3 (faster C row adaptation) when it is installed; set
+    DB_DRIVER=psycopg2 to force the psycopg2 driver.
+    """
+    for scheme in ("postgres://", "postgresql://"):
+        if url.startswith(scheme):
+            driver = os.getenv("DB_DRIVER", "").lower()
+            if not driver:
+                driver = "psycopg" if importlib.util.find_spec("psycopg") else "psycopg2"
+            return f"postgresql+{driver}://" + url[len(scheme):]
+    return url
+
+
+DATABASE_URL = _normalize_postgres_url(DATABASE_URL)
+
+# Static connection details, computed once for get_database_info()
+_DB_TYPE = "sqlite" if DATABASE_URL.startswith("sqlite") else "postgresql"
+_SANITIZED_URL = DATABASE_URL.rsplit("@", 1)[-1] if "@" in DATABASE_URL else DATABASE_URL
+
+# Connectivity probe used by health checks
+_PING_STMT = text("SELECT 1")
+
+# Connection pool settings (PostgreSQL only)
+DB_POOL_SIZE = max(1, int(os.getenv("DB_POOL_SIZE", "20")))
+DB_MAX_OVERFLOW = max(0, int(os.getenv("DB_MAX_OVERFLOW", "30")))
+DB_POOL_TIMEOUT = max(1, int(os.getenv("DB_POOL_TIMEOUT", "30")))
+# Must stay below any server/proxy idle timeout (e.g. pgbouncer's 600s
+# server_idle_timeout); RDS and most managed Postgres allow far longer
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# pool_recycle is the first line of defence against stale connections;
+# pre-ping catches the rest (DB restarts, failovers) at the cost of one
+# dialect-level ping per checkout. Off by default for local SQLite files.
+DB_POOL_PRE_PING = os.getenv(
+    "DB_POOL_PRE_PING",
+    "false" if _DB_TYPE == "sqlite" else "true"
+).lower() == "true"
+
+# Keep pool_size + max_overflow below the server's max_connections so a burst
+# of requests can't exhaust Postgres (per worker process)
+_max_connections_ceiling = os.getenv("DB_MAX_CONNECTIONS_CEILING")
+if _max_connections_ceiling:
+    _ceiling = max(1, int(_max_connections_ceiling))
+    if DB_POOL_SIZE + DB_MAX_OVERFLOW > _ceiling:
+        DB_POOL_SIZE = min(DB_POOL_SIZE, _ceiling)
+        DB_MAX_OVERFLOW = _ceiling - DB_POOL_SIZE
+        logger.warning(
+            "DB pool capped at %d connections (pool_size=%d, max_overflow=%d)",
+            _ceiling, DB_POOL_SIZE, DB_MAX_OVERFLOW
+        )
+
+# Compiled SQL cache entries per engine (SQLAlchemy default is 500)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
+# Engine settings per backend
+_SQLITE_ENGINE_KW = {
     # SQLite configuration for development
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={
-            "check_same_thread": False,  # Allow multi-threading
-            "timeout": 20  # Timeout for database operations
-        },
-        poolclass=StaticPool,  # Use static pool for SQLite
-        echo=ENVIRONMENT == "development"  # Log SQL queries in development
-    )
-else:
+    "connect_args": {
+        "check_same_thread": False,  # Allow multi-threading
+        "timeout": 20  # Timeout for database operations
+    },
+    "pool_pre_ping": DB_POOL_PRE_PING,
+    "query_cache_size": DB_QUERY_CACHE_SIZE,
+    "echo": ENVIRONMENT == "development"  # Log SQL queries in development
+}
+
+_POSTGRES_ENGINE_KW = {
     # PostgreSQL configuration for production
-    engine = create_engine(
-        DATABASE_URL,
-        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
-        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
-        pool_pre_ping=True,  # Verify connections before use
-        pool_recycle=300,  # Recycle connections after 5 minutes
-        echo=False  # Don't log SQL queries in production
-    )
+    "connect_args": {
+        # libpq TCP keepalives: detect dead connections (NAT/LB drops)
+        # in ~30s + 5 * 10s instead of the OS default of ~2 hours
+        "keepalives": 1,
+        "keepalives_idle": int(os.getenv("DB_KEEPALIVES_IDLE", "30")),
+        "keepalives_interval": int(os.getenv("DB_KEEPALIVES_INTERVAL", "10")),
+        "keepalives_count": int(os.getenv("DB_KEEPALIVES_COUNT", "5")),
+        "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
+    },
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,  # Seconds to wait for a free connection
+    "pool_pre_ping": DB_POOL_PRE_PING,  # Verify connections before use
+    "pool_recycle": DB_POOL_RECYCLE,  # Recycle connections after 30 minutes by default
+    "query_cache_size": DB_QUERY_CACHE_SIZE,
+    "echo": False  # Don't log SQL queries in production
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent reads and enforce foreign keys."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")  # Readers don't block the writer
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, far fewer fsyncs
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")  # ~64MB page cache
+    cursor.execute("PRAGMA foreign_keys=ON")  # Enforce ON DELETE CASCADE, as Postgres does
+    cursor.close()
+
+
+def _build_engine(url: str) -> Engine:
+    """Create the SQLAlchemy engine for a database URL."""
+    if url.startswith("sqlite"):
+        # An in-memory database only lives as long as its connection, so it
+        # must be shared; file databases open a fresh connection per session
+        # so WAL readers run in parallel instead of queueing on one handle
+        poolclass = StaticPool if ":memory:" in url or url == "sqlite://" else NullPool
+        sqlite_engine = create_engine(url, poolclass=poolclass, **_SQLITE_ENGINE_KW)
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+    return create_engine(url, **_POSTGRES_ENGINE_KW)
+
+
+# The engine is built on first use, so importing this module (Alembic,
+# CLI scripts, test collection) does no pool or driver setup
+_engine: Optional[Engine] = None
+
+
+def get_engine() -> Engine:
+    """Get the application engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = _build_engine(DATABASE_URL)
+    return _engine
+
+
+def __getattr__(name: str):
+    # Keep `from app.database import engine` working
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that binds to the application engine on first call."""
+    
+    def __call__(self, **local_kw) -> Session:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(
+# expire_on_commit=False: objects stay readable after commit (e.g. when
+# building the response) without a re-SELECT per instance
+SessionLocal = _LazySessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False
 )
 
-# Import Base from models (defined there to avoid circular imports)
-# Will be imported when models are loaded
+# Base is defined in app.models (to avoid circular imports) and resolved
+# lazily on first use by _get_base()
+_Base = None
+
+
+def _get_base():
+    """Get the declarative Base, importing the models on first use."""
+    global _Base
+    if _Base is None:
+        from app.models import Base
+        _Base = Base
+    return _Base
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -72,21 +211,48 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provide a short-lived session around a single unit of database work.
+    
+    Commits on success, rolls back on error and always returns the connection
+    to the pool, so slow external calls (SMTP, Google APIs) can be kept outside
+    the block instead of holding a pooled connection.
+    
+    Usage:
+        with session_scope() as db:
+            db.add(obj)
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def create_tables():
     """
     Create all database tables.
     
     This function creates all tables defined in the models.
-    Should be called during application startup.
+    Should be called during application startup. Returns early when every
+    table already exists, which avoids a per-table existence check on each
+    process start.
     """
-    # Import models to ensure they're registered
-    import importlib
-    try:
-        models_module = importlib.import_module('app.models')
-        Base = getattr(models_module, 'Base')
-        Base.metadata.create_all(bind=engine)
-    except (ImportError, AttributeError) as e:
-        print(f"Warning: Could not import models: {e}")
+    metadata = _get_base().metadata
+    db_engine = get_engine()
+    existing = set(inspect(db_engine).get_table_names())
+    missing = set(metadata.tables) - existing
+    if not missing:
+        return
+    
+    logger.info("Creating missing tables: %s", ", ".join(sorted(missing)))
+    metadata.create_all(bind=db_engine)
 
 
 def drop_tables():
@@ -96,14 +262,49 @@ def drop_tables():
     WARNING: This will delete all data!
     Only use for testing or development reset.
     """
-    # Import models to ensure they're registered
-    import importlib
-    try:
-        models_module = importlib.import_module('app.models')
-        Base = getattr(models_module, 'Base')
-        Base.metadata.drop_all(bind=engine)
-    except (ImportError, AttributeError) as e:
-        print(f"Warning: Could not import models: {e}")
+    _get_base().metadata.drop_all(bind=get_engine())
+
+
+def _get_pool_settings() -> dict:
+    """Get the resolved connection pool settings."""
+    engine = get_engine()
+    if _DB_TYPE == "sqlite":
+        return {
+            "pool_class": type(engine.pool).__name__,
+            "pool_pre_ping": DB_POOL_PRE_PING
+        }
+    return {
+        "pool_class": type(engine.pool).__name__,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE
+    }
+
+
+def get_pool_status(db_engine: Optional[Engine] = None) -> dict:
+    """
+    Get live connection pool counters.
+    
+    Only QueuePool exposes counters; other pool classes report their name.
+    
+    Args:
+        db_engine: Engine to inspect (defaults to the application engine)
+    
+    Returns:
+        dict: Pool size, checked-in/out and overflow connections
+    """
+    pool = (db_engine or get_engine()).pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__}
+    return {
+        "pool_class": type(pool).__name__,
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow()
+    }
 
 
 def get_database_info() -> dict:
@@ -114,27 +315,35 @@ def get_database_info() -> dict:
         dict: Database connection details
     """
     return {
-        "database_url": DATABASE_URL.split("@")[-1] if "@" in DATABASE_URL else DATABASE_URL,
-        "database_type": "sqlite" if DATABASE_URL.startswith("sqlite") else "postgresql",
+        "database_url": _SANITIZED_URL,
+        "database_type": _DB_TYPE,
         "environment": ENVIRONMENT,
-        "echo_queries": engine.echo
+        "echo_queries": get_engine().echo,
+        "query_cache_size": DB_QUERY_CACHE_SIZE,
+        "pool_settings": _get_pool_settings()
     }
 
 
-def check_database_connection() -> bool:
+def check_database_connection(db_engine: Optional[Engine] = None) -> bool:
     """
     Check if database connection is working.
     
+    Args:
+        db_engine: Engine to check (defaults to the application engine)
+    
     Returns:
         bool: True if connection is successful, False otherwise
     """
     try:
-        with engine.connect() as connection:
+        # AUTOCOMMIT skips BEGIN/ROLLBACK (and a Postgres snapshot) for the ping
+        with (db_engine or get_engine()).connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
             # Try a simple query
-            connection.execute(text("SELECT 1"))
+            connection.scalar(_PING_STMT)
             return True
-    except Exception as e:
-        print(f"Database connection failed: {e}")
+    except Exception:
+        logger.exception("Database connection failed")
         return False
 
 
@@ -145,22 +354,52 @@ class DatabaseManager:
     Provides utilities for database management, migrations, and health checks.
     """
     
-    def __init__(self):
-        self.engine = engine
-        self.session_local = SessionLocal
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        session_factory: Optional[sessionmaker] = None
+    ):
+        """
+        Initialize database manager.
+        
+        Args:
+            engine: Engine to manage (defaults to the application engine)
+            session_factory: Session factory (defaults to one bound to engine)
+        """
+        self._engine = engine
+        if engine is None:
+            self.session_local = session_factory or SessionLocal
+        else:
+            self.session_local = session_factory or sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=engine
+            )
+    
+    @property
+    def engine(self) -> Engine:
+        """Engine managed by this instance (the application engine by default)."""
+        return self._engine or get_engine()
+    
+    @classmethod
+    def from_url(cls, url: str) -> "DatabaseManager":
+        """Create a manager with its own engine, e.g. for a test database."""
+        return cls(engine=_build_engine(url))
         
     def create_all_tables(self):
         """Create all database tables."""
-        create_tables()
+        _get_base().metadata.create_all(bind=self.engine)
         
     def drop_all_tables(self):
         """Drop all database tables."""
-        drop_tables()
+        _get_base().metadata.drop_all(bind=self.engine)
         
     def reset_database(self):
         """Reset database by dropping and recreating all tables."""
-        self.drop_all_tables()
-        self.create_all_tables()
+        metadata = _get_base().metadata
+        metadata.drop_all(bind=self.engine)
+        metadata.create_all(bind=self.engine)
         
     def get_session(self) -> Session:
         """Get a new database session."""
@@ -174,8 +413,9 @@ class DatabaseManager:
             dict: Health check results
         """
         try:
-            connection_ok = check_database_connection()
+            connection_ok = check_database_connection(self.engine)
             db_info = get_database_info()
+            db_info["pool_status"] = get_pool_status(self.engine)
             
             return {
                 "status": "healthy" if connection_ok else "unhealthy",
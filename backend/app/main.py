@@ -5,40 +5,155 @@ Provides REST API endpoints for campaign management, Google Sheets integration,
 and email sending functionality.
 """
 
+import asyncio
+import hashlib
 import os
-import traceback
 import random
+import re
 import time
 import json
+import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exception_handlers import http_exception_handler
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, func, insert, select, tuple_, update
+from sqlalchemy.orm import Session, aliased, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel, Field
+import anyio.to_thread
+import orjson
 import uvicorn
 
 # Local imports
-from app.database import get_db, create_tables, db_manager, SessionLocal
-from app.models import Campaign, EmailSend, EmailTemplate, CampaignStatus, EmailStatus
+from app.database import (
+    get_db, create_tables, db_manager, SessionLocal, get_database_info, session_scope,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW
+)
+from app.models import (
+    Campaign, EmailSend, EmailTemplate, CampaignStatus, EmailStatus
+)
 from app.schemas import (
     CampaignCreate, CampaignUpdate, CampaignResponse, CampaignSummary,
     EmailSendResponse, HealthCheck, ErrorResponse, SuccessResponse,
-    PaginationParams, PaginatedResponse,
+    PaginationParams, CursorPaginationParams, PaginatedResponse,
     EmailTemplateCreate, EmailTemplateUpdate, EmailTemplateResponse, EmailTemplateSummary
 )
 from app.services.google_sheets import (
     GoogleSheetsService, GoogleSheetsError, GoogleSheetsAuthError,
-    GoogleSheetsAccessError, GoogleSheetsValidationError
+    GoogleSheetsAccessError, GoogleSheetsValidationError, EmailRow, SheetUpdateBuffer
 )
 from app.services.email_service import (
     EmailService, EmailServiceError, EmailConnectionError,
     EmailAuthenticationError, create_email_service
 )
+from app.services.campaign_stats import CampaignStatsBuffer, campaign_counts_update
+from app.services.task_service import get_tasks_service
+from app.utils.log_queue import start_log_listener, stop_log_listener
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background refreshes of the /api/health snapshot
+HEALTH_REFRESH_INTERVAL = int(os.getenv("HEALTH_REFRESH_INTERVAL", "30"))
+
+# Seconds between flushes of buffered Google Sheets "mark as sent" writes
+SHEETS_FLUSH_INTERVAL = int(os.getenv("SHEETS_FLUSH_INTERVAL", "10"))
+
+# Seconds between flushes of buffered campaign statistics
+CAMPAIGN_STATS_FLUSH_INTERVAL = int(os.getenv("CAMPAIGN_STATS_FLUSH_INTERVAL", "5"))
+
+# Seconds a serialized campaign/template GET body is reused. Entries are also
+# dropped whenever the row is written, so this only bounds staleness from
+# writers outside this process
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "5"))
+
+# Serialized single-object GET bodies, keyed by ("campaign" | "template", id)
+response_cache = TTLCache(ttl=RESPONSE_CACHE_TTL, maxsize=4096)
+
+# Worker threads for sync endpoints, dependencies and run_in_threadpool calls
+# (anyio's default is 40). Defaults to the DB pool's capacity so a burst of
+# Cloud Tasks requests can use every connection instead of queueing for a thread
+THREADPOOL_SIZE = max(1, int(os.getenv("THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW))))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services and database before serving, clean up on shutdown."""
+    start_log_listener()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    # Services stay None if initialization fails; dependencies then return 503
+    app.state.google_sheets_service = None
+    app.state.email_service = None
+    app.state.sheet_update_buffer = None
+    app.state.last_health = None
+    app.state.campaign_stats_buffer = CampaignStatsBuffer(
+        on_flush=lambda campaign_id: response_cache.delete(("campaign", campaign_id))
+    )
+    
+    try:
+        # Create database tables
+        create_tables()
+        logger.info("📊 Database tables created/verified")
+        logger.info("🔌 Database pool: %s", get_database_info()['pool_settings'])
+        
+        # Initialize Google Sheets service and build the authorized API
+        # client now, so the first request doesn't pay for discovery/auth
+        app.state.google_sheets_service = GoogleSheetsService()
+        try:
+            app.state.google_sheets_service._get_service()
+        except Exception as e:
+            logger.warning("⚠️  Google Sheets client not pre-built: %s", e)
+        app.state.sheet_update_buffer = SheetUpdateBuffer(
+            app.state.google_sheets_service,
+            on_flushed=record_sheet_updates
+        )
+        logger.info("📋 Google Sheets service initialized")
+        
+        # Create the Cloud Tasks client (gRPC channel) once per process
+        try:
+            get_tasks_service()
+        except Exception as e:
+            logger.warning("⚠️  Cloud Tasks client not pre-built: %s", e)
+        
+        # Initialize Email service and open its first SMTP connection
+        app.state.email_service = create_email_service()
+        try:
+            app.state.email_service.warm_up()
+        except Exception as e:
+            logger.warning("⚠️  SMTP connection not pre-opened: %s", e)
+        logger.info("📧 Email service initialized")
+        
+        logger.info("🚀 Email Campaign API started successfully")
+        
+    except Exception as e:
+        logger.exception("❌ Startup error: %s", e)
+    
+    # Probe dependencies in the background; /api/health serves the snapshot
+    health_task = asyncio.create_task(periodic_health_refresh(app))
+    sheet_flush_task = asyncio.create_task(periodic_sheet_flush(app))
+    stats_flush_task = asyncio.create_task(periodic_stats_flush(app))
+    
+    yield
+    
+    health_task.cancel()
+    sheet_flush_task.cancel()
+    stats_flush_task.cancel()
+    await run_in_threadpool(app.state.campaign_stats_buffer.flush_all)
+    if app.state.sheet_update_buffer is not None:
+        await run_in_threadpool(app.state.sheet_update_buffer.flush_all)
+    if app.state.email_service is not None:
+        app.state.email_service.close()
+    logger.info("👋 Email Campaign API shutting down")
+    stop_log_listener()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -46,7 +161,8 @@ app = FastAPI(
     description="REST API for managing email campaigns with Google Sheets integration",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware configuration
@@ -68,43 +184,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
-# Global services (initialized on startup)
-google_sheets_service: Optional[GoogleSheetsService] = None
-email_service: Optional[EmailService] = None
 
-
-# Startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services and database on startup."""
-    global google_sheets_service, email_service
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which serializes datetimes natively."""
     
-    try:
-        # Create database tables
-        create_tables()
-        print("📊 Database tables created/verified")
-        
-        # Initialize Google Sheets service
-        google_sheets_service = GoogleSheetsService()
-        print("📋 Google Sheets service initialized")
-        
-        # Initialize Email service
-        email_service = create_email_service()
-        print("📧 Email service initialized")
-        
-        print("🚀 Email Campaign API started successfully")
-        
-    except Exception as e:
-        print(f"❌ Startup error: {e}")
-        traceback.print_exc()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    print("👋 Email Campaign API shutting down")
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
 
 
 # Custom exception handlers
@@ -120,12 +208,12 @@ async def google_sheets_exception_handler(request, exc: GoogleSheetsError):
     elif isinstance(exc, GoogleSheetsValidationError):
         status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
     
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status_code,
         content={
             "error": "Google Sheets Error",
             "detail": str(exc),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
     )
 
@@ -140,12 +228,12 @@ async def email_service_exception_handler(request, exc: EmailServiceError):
     elif isinstance(exc, EmailAuthenticationError):
         status_code = status.HTTP_401_UNAUTHORIZED
     
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status_code,
         content={
             "error": "Email Service Error",
             "detail": str(exc),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
     )
 
@@ -153,19 +241,20 @@ async def email_service_exception_handler(request, exc: EmailServiceError):
 @app.exception_handler(SQLAlchemyError)
 async def database_exception_handler(request, exc: SQLAlchemyError):
     """Handle database errors."""
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Database Error",
             "detail": "An error occurred while accessing the database",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
     )
 
 
 # Utility functions
-def get_google_sheets_service() -> GoogleSheetsService:
+def get_google_sheets_service(request: Request) -> GoogleSheetsService:
     """Get Google Sheets service instance."""
+    google_sheets_service = getattr(request.app.state, "google_sheets_service", None)
     if google_sheets_service is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -174,8 +263,9 @@ def get_google_sheets_service() -> GoogleSheetsService:
     return google_sheets_service
 
 
-def get_email_service() -> EmailService:
+def get_email_service(request: Request) -> EmailService:
     """Get Email service instance."""
+    email_service = getattr(request.app.state, "email_service", None)
     if email_service is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -212,14 +302,151 @@ class CampaignSendRequest(BaseModel):
     test_mode: bool = Field(default=False, description="Send in test mode (mock)")
 
 
+# Template placeholders such as {{name}} or {{First Name}} (sheet headers may
+# contain spaces, so this matches anything up to the closing braces)
+TEMPLATE_VAR_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+# Campaign columns CampaignResponse reads; selecting them as a plain row
+# skips ORM instance construction on the single-campaign GET
+CAMPAIGN_RESPONSE_COLUMNS = [
+    column for name, column in Campaign.__table__.c.items()
+    if name in CampaignResponse.model_fields
+]
+EMAIL_SEND_RESPONSE_COLUMNS = [
+    column for name, column in EmailSend.__table__.c.items()
+    if name in EmailSendResponse.model_fields
+]
+
+# Single-campaign lookups, built once and executed with a campaign_id parameter
+CAMPAIGN_ROW_BY_ID = select(*CAMPAIGN_RESPONSE_COLUMNS).where(Campaign.id == bindparam("campaign_id"))
+CAMPAIGN_STATUS_BY_ID = select(Campaign.status).where(Campaign.id == bindparam("campaign_id"))
+CAMPAIGN_SHEET_ID_BY_ID = select(Campaign.google_sheet_id).where(Campaign.id == bindparam("campaign_id"))
+CAMPAIGN_EXISTS_BY_ID = select(Campaign.id).where(Campaign.id == bindparam("campaign_id"))
+
+# EmailSend rows inserted per statement when starting a campaign
+EMAIL_SEND_INSERT_BATCH_SIZE = 1000
+
+# Campaign status transitions guarded by the update/send/stop endpoints
+NON_UPDATABLE_STATUSES = frozenset({CampaignStatus.SENDING, CampaignStatus.COMPLETED})
+SENDABLE_STATUSES = frozenset({CampaignStatus.DRAFT, CampaignStatus.SCHEDULED})
+STOPPABLE_STATUSES = frozenset({CampaignStatus.SENDING, CampaignStatus.SCHEDULED})
+
+
+@lru_cache(maxsize=64)
+def parse_status_filter(status_enum: type, value: str):
+    """
+    Map a status_filter query parameter to a status enum member.
+    
+    Raises:
+        ValueError: If value isn't a status of status_enum
+    """
+    return status_enum(value.lower())
+
+
+def cached_json_response(request: Request, key: tuple, build) -> Response:
+    """
+    Serve a JSON body from response_cache with a weak ETag.
+    
+    Answers 304 Not Modified when the request's If-None-Match matches, so
+    polling clients skip both the body and (on a cache hit) the database.
+    
+    Args:
+        request: Incoming request
+        key: response_cache key
+        build: Callable returning the serialized body on a cache miss
+        
+    Returns:
+        Response: 200 with the body, or 304
+    """
+    def build_entry():
+        body = build()
+        return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"', body
+    
+    etag, body = response_cache.get_or_set(key, build_entry)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(body, media_type="application/json", headers=headers)
+
+
 # Background task functions
-def send_single_email_task(email_send_id: int, db_session=None) -> dict:
+def record_sheet_updates(email_send_ids: List[int]):
+    """Flag EmailSend records whose sheet rows were marked as sent."""
+    with session_scope() as db:
+        db.execute(
+            update(EmailSend)
+            .where(EmailSend.id.in_(email_send_ids))
+            .values(marked_as_sent_in_sheet=True)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def insert_email_sends(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert EmailSend rows with one executemany INSERT ... RETURNING.
+    
+    SQLAlchemy batches this with insertmanyvalues on both SQLite and
+    PostgreSQL; ids come back in row order for task scheduling.
+    """
+    if not rows:
+        return []
+    return db.execute(
+        insert(EmailSend).returning(EmailSend.id, sort_by_parameter_order=True),
+        rows
+    ).scalars().all()
+
+
+def update_email_send(db: Session, email_send_id: int, **values):
+    """Write EmailSend column changes as a single UPDATE and commit."""
+    db.execute(update(EmailSend).where(EmailSend.id == email_send_id).values(**values))
+    db.commit()
+
+
+def get_campaign_status(db: Session, campaign_id: int) -> CampaignStatus:
+    """
+    Get a campaign's current status.
+    
+    Used after a guarded UPDATE matched no row, to tell a missing campaign
+    (404) from one in the wrong status.
+    """
+    campaign_status = db.scalar(CAMPAIGN_STATUS_BY_ID, {"campaign_id": campaign_id})
+    if campaign_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    return campaign_status
+
+
+async def periodic_sheet_flush(app: FastAPI):
+    """Write buffered "mark as sent" rows to Google Sheets every SHEETS_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(SHEETS_FLUSH_INTERVAL)
+        if app.state.sheet_update_buffer is not None:
+            await run_in_threadpool(app.state.sheet_update_buffer.flush_all)
+
+
+async def periodic_stats_flush(app: FastAPI):
+    """Apply buffered campaign statistics every CAMPAIGN_STATS_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(CAMPAIGN_STATS_FLUSH_INTERVAL)
+        if app.state.campaign_stats_buffer.pending_count():
+            await run_in_threadpool(app.state.campaign_stats_buffer.flush_all)
+
+
+def send_single_email_task(email_send_id: int, db_session=None, rate_limited: bool = False) -> dict:
     """
     Send a single email as part of a campaign. Used by Cloud Tasks.
     
     Args:
         email_send_id: ID of the EmailSend record to process
         db_session: Optional database session (will create one if not provided)
+        rate_limited: True if the caller already waited for the send rate limit
         
     Returns:
         Dictionary with result status and details
@@ -235,8 +462,13 @@ def send_single_email_task(email_send_id: int, db_session=None) -> dict:
         should_close_db = False
     
     try:
-        # Get email send record
-        email_send = db.query(EmailSend).filter(EmailSend.id == email_send_id).first()
+        # Get email send record together with its campaign in one query
+        email_send = (
+            db.query(EmailSend)
+            .options(joinedload(EmailSend.campaign))
+            .filter(EmailSend.id == email_send_id)
+            .first()
+        )
         if not email_send:
             return {'status': 'error', 'message': 'EmailSend record not found'}
         
@@ -244,24 +476,27 @@ def send_single_email_task(email_send_id: int, db_session=None) -> dict:
         if email_send.status != EmailStatus.PENDING:
             return {'status': 'skipped', 'message': f'Email status is {email_send.status.value}'}
         
-        # Get campaign details
-        campaign = db.query(Campaign).filter(Campaign.id == email_send.campaign_id).first()
+        campaign = email_send.campaign
         if not campaign:
             return {'status': 'error', 'message': 'Campaign not found'}
         
         # Check if campaign is still active
         if campaign.status == CampaignStatus.CANCELLED:
-            email_send.status = EmailStatus.SKIPPED
-            email_send.error_message = "Campaign was cancelled"
-            db.commit()
+            update_email_send(
+                db, email_send.id,
+                status=EmailStatus.SKIPPED,
+                error_message="Campaign was cancelled"
+            )
             return {'status': 'skipped', 'message': 'Campaign was cancelled'}
         
-        print(f"📧 Sending email to {email_send.recipient_email} for campaign: {campaign.name}")
+        logger.debug("📧 Sending email to %s for campaign: %s", email_send.recipient_email, campaign.name)
         
         # Check if services are available
+        email_service = getattr(app.state, "email_service", None)
+        sheet_update_buffer = getattr(app.state, "sheet_update_buffer", None)
         if not email_service:
             raise Exception("Email service not initialized")
-        if not google_sheets_service:
+        if not sheet_update_buffer:
             raise Exception("Google Sheets service not initialized")
         
         try:
@@ -270,91 +505,89 @@ def send_single_email_task(email_send_id: int, db_session=None) -> dict:
                 email=email_send.recipient_email, 
                 name=email_send.recipient_name
             )
-            from_address = EmailAddress(
-                email=email_service.default_from_email,
-                name=email_service.default_from_name
-            )
             
-            # Create email message
+            # Create email message (the default sender address is shared)
             email_message = EmailMessage(
                 to=to_address,
                 subject=email_send.personalized_subject,
                 body=email_send.personalized_message,
-                from_email=from_address
+                from_email=email_service.default_from_address
             )
             
             # Send email
-            result = email_service.send_email(email_message)
+            result = email_service.send_email(email_message, rate_limited=rate_limited)
             
             if result.success:
-                # Mark as sent
-                email_send.status = EmailStatus.SENT
-                email_send.sent_at = datetime.utcnow()
-                email_send.smtp_response = result.smtp_response
+                # Mark as sent and count the attempt
+                update_email_send(
+                    db, email_send.id,
+                    status=EmailStatus.SENT,
+                    sent_at=datetime.utcnow(),
+                    smtp_response=result.smtp_response,
+                    send_attempts=EmailSend.send_attempts + 1
+                )
                 
-                print(f"✅ Successfully sent email to {email_send.recipient_email}")
+                logger.debug("✅ Successfully sent email to %s", email_send.recipient_email)
                 
-                # Mark as sent in Google Sheets (if row number available)
+                # Queue the Google Sheets update (if row number available);
+                # marked_as_sent_in_sheet is set once the batch is written
                 if email_send.sheet_row_number:
-                    try:
-                        # Create a minimal email row object for the sheet update
-                        from app.services.google_sheets import EmailRow
-                        email_row = EmailRow(
-                            row_number=email_send.sheet_row_number,
-                            email=email_send.recipient_email,
-                            name=email_send.recipient_name,
-                            is_valid=True
-                        )
-                        
-                        google_sheets_service.mark_emails_as_sent(
-                            campaign.google_sheet_id,
-                            [email_row],
-                            status_column='sent'
-                        )
-                        email_send.marked_as_sent_in_sheet = True
-                        print(f"✅ Marked as sent in Google Sheets")
-                    except Exception as sheet_error:
-                        print(f"⚠️  Could not mark email as sent in sheet: {sheet_error}")
-                
-                # Update send attempts and commit
-                email_send.send_attempts += 1
-                db.commit()
+                    # Create a minimal email row object for the sheet update
+                    email_row = EmailRow(
+                        row_number=email_send.sheet_row_number,
+                        email=email_send.recipient_email,
+                        name=email_send.recipient_name,
+                        is_valid=True
+                    )
+                    sheet_update_buffer.add(
+                        campaign.google_sheet_id,
+                        email_send.id,
+                        email_row,
+                        status_column='sent'
+                    )
                 
                 return {
                     'status': 'success', 
                     'message': f'Email sent to {email_send.recipient_email}',
-                    'smtp_response': result.smtp_response
+                    'smtp_response': result.smtp_response,
+                    'campaign_id': campaign.id
                 }
                 
             else:
                 # Mark as failed
-                email_send.status = EmailStatus.FAILED
-                email_send.error_message = result.error_message
-                email_send.send_attempts += 1
-                db.commit()
+                update_email_send(
+                    db, email_send.id,
+                    status=EmailStatus.FAILED,
+                    error_message=result.error_message,
+                    send_attempts=EmailSend.send_attempts + 1
+                )
                 
-                print(f"❌ Failed to send email to {email_send.recipient_email}: {result.error_message}")
+                logger.warning("❌ Failed to send email to %s: %s", email_send.recipient_email, result.error_message)
                 
                 return {
                     'status': 'failed',
                     'message': f'Email failed: {result.error_message}',
-                    'smtp_response': result.smtp_response
+                    'smtp_response': result.smtp_response,
+                    'campaign_id': campaign.id
                 }
                 
         except Exception as email_error:
-            email_send.status = EmailStatus.FAILED
-            email_send.error_message = str(email_error)
-            email_send.send_attempts += 1
-            db.commit()
+            db.rollback()
+            update_email_send(
+                db, email_send.id,
+                status=EmailStatus.FAILED,
+                error_message=str(email_error),
+                send_attempts=EmailSend.send_attempts + 1
+            )
             
             error_msg = f"Error sending email to {email_send.recipient_email}: {email_error}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             
-            return {'status': 'error', 'message': error_msg}
+            return {'status': 'error', 'message': error_msg, 'campaign_id': campaign.id}
             
     except Exception as e:
         error_msg = f"Unexpected error processing email_send_id {email_send_id}: {e}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return {'status': 'error', 'message': error_msg}
         
     finally:
@@ -383,19 +616,25 @@ def start_campaign_with_cloud_tasks(campaign_id: int) -> dict:
     
     try:
         # Get campaign details
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         if not campaign:
             return {'status': 'error', 'message': 'Campaign not found'}
         
-        print(f"🚀 Starting campaign with Cloud Tasks: {campaign.name} (ID: {campaign_id})")
+        logger.info("🚀 Starting campaign with Cloud Tasks: %s (ID: %s)", campaign.name, campaign_id)
         
         # Log business hours configuration
         if campaign.respect_business_hours:
-            print(f"⏰ Business hours enabled: {campaign.business_hours_start or 7}:00-{campaign.business_hours_end or 17}:00")
-            print(f"📅 Timezone: {campaign.timezone or 'UTC'}")
-            print(f"🗓️  Business days only: {campaign.business_days_only if campaign.business_days_only is not None else True}")
+            logger.info(
+                "⏰ Business hours enabled: %s:00-%s:00", 
+                campaign.business_hours_start or 7, campaign.business_hours_end or 17
+            )
+            logger.info("📅 Timezone: %s", campaign.timezone or 'UTC')
+            logger.info(
+                "🗓️  Business days only: %s", 
+                campaign.business_days_only if campaign.business_days_only is not None else True
+            )
         else:
-            print(f"🌍 24/7 scheduling: Business hours restrictions disabled")
+            logger.info("🌍 24/7 scheduling: Business hours restrictions disabled")
         
         # Update campaign status to sending
         campaign.status = CampaignStatus.SENDING
@@ -403,79 +642,99 @@ def start_campaign_with_cloud_tasks(campaign_id: int) -> dict:
         db.commit()
         
         # Get email list from Google Sheets
+        google_sheets_service = getattr(app.state, "google_sheets_service", None)
         if not google_sheets_service:
             raise Exception("Google Sheets service not initialized")
         
+        # Stream rows from the sheet and insert EmailSend records in batches,
+        # so the parsed rows and insert parameters for the whole sheet are
+        # never held in memory at once
+        email_send_ids = []
+        email_send_rows = []
+        total_rows = 0
+        valid_email_count = 0
+        
+        # Read campaign attributes once rather than per recipient
+        subject_template = campaign.subject
+        message_template = campaign.message
+        
         try:
-            email_data = google_sheets_service.read_email_addresses(
+            for email_row in google_sheets_service.iter_email_addresses(
                 campaign.google_sheet_id,
                 campaign.google_sheet_range
-            )
-            print(f"📋 Retrieved {len(email_data)} emails from Google Sheets")
-        except Exception as e:
-            print(f"❌ Error retrieving emails from Google Sheets: {e}")
+            ):
+                total_rows += 1
+                
+                # Rows come back stripped and validated; skip the rejects
+                if not email_row.is_valid:
+                    logger.debug(
+                        "⚠️  Skipping invalid email at row %s: %s", 
+                        email_row.row_number, email_row.validation_error or 'invalid email'
+                    )
+                    continue
+                
+                valid_email_count += 1
+                
+                recipient_email = email_row.email
+                recipient_name = email_row.name
+                
+                # Replace template variables in one pass each; unknown
+                # placeholders are left as-is
+                template_vars = {
+                    'name': recipient_name or recipient_email.split('@')[0],
+                    'email': recipient_email,
+                    **(email_row.additional_data or {})
+                }
+                
+                def substitute(match):
+                    var_name = match.group(1)
+                    if var_name not in template_vars:
+                        return match.group(0)
+                    return str(template_vars[var_name])
+                
+                personalized_subject = TEMPLATE_VAR_PATTERN.sub(substitute, subject_template)
+                personalized_message = TEMPLATE_VAR_PATTERN.sub(substitute, message_template)
+                
+                email_send_rows.append({
+                    'campaign_id': campaign_id,
+                    'recipient_email': recipient_email,
+                    'recipient_name': recipient_name,
+                    'personalized_subject': personalized_subject,
+                    'personalized_message': personalized_message,
+                    'sheet_row_number': email_row.row_number,
+                    'status': EmailStatus.PENDING
+                })
+                
+                if len(email_send_rows) >= EMAIL_SEND_INSERT_BATCH_SIZE:
+                    email_send_ids.extend(insert_email_sends(db, email_send_rows))
+                    email_send_rows = []
+            
+            email_send_ids.extend(insert_email_sends(db, email_send_rows))
+            logger.info("📋 Retrieved %s emails from Google Sheets", total_rows)
+        except GoogleSheetsError as e:
+            logger.error("❌ Error retrieving emails from Google Sheets: %s", e)
+            db.rollback()  # Discard records inserted before the error
             campaign.status = CampaignStatus.FAILED
             campaign.error_message = f"Google Sheets error: {str(e)}"
             campaign.completed_at = datetime.utcnow()
             db.commit()
             return {'status': 'error', 'message': f'Google Sheets error: {str(e)}'}
         
-        # Update total recipients count
-        campaign.total_recipients = len(email_data)
+        # Seed the counters from the records just created; from here on they
+        # move incrementally (CampaignStatsBuffer as emails are sent, below
+        # for emails that can't be queued) rather than being recounted
+        campaign.total_recipients = len(email_send_ids)
+        campaign.emails_sent = 0
+        campaign.emails_failed = 0
+        campaign.emails_pending = len(email_send_ids)
         db.commit()
-        
-        # Create EmailSend records for all emails
-        email_send_ids = []
-        valid_email_count = 0
-        
-        for email_row in email_data:
-            if not email_row.email.strip() or not email_row.is_valid:
-                print(f"⚠️  Skipping invalid email at row {email_row.row_number}: {email_row.validation_error or 'invalid email'}")
-                continue
-            
-            valid_email_count += 1
-            
-            recipient_email = email_row.email.strip()
-            recipient_name = email_row.name.strip() if email_row.name else None
-            
-            # Personalize subject and message
-            personalized_subject = campaign.subject
-            personalized_message = campaign.message
-            
-            # Replace template variables
-            template_vars = {
-                'name': recipient_name or recipient_email.split('@')[0],
-                'email': recipient_email,
-                **(email_row.additional_data or {})
-            }
-            
-            for var_name, var_value in template_vars.items():
-                personalized_subject = personalized_subject.replace(f"{{{{{var_name}}}}}", str(var_value))
-                personalized_message = personalized_message.replace(f"{{{{{var_name}}}}}", str(var_value))
-            
-            # Create email send record
-            email_send = EmailSend(
-                campaign_id=campaign_id,
-                recipient_email=recipient_email,
-                recipient_name=recipient_name,
-                personalized_subject=personalized_subject,
-                personalized_message=personalized_message,
-                sheet_row_number=email_row.row_number,
-                status=EmailStatus.PENDING
-            )
-            db.add(email_send)
-            db.flush()  # Get the ID without committing
-            email_send_ids.append(email_send.id)
-        
-        db.commit()
-        print(f"📝 Created {valid_email_count} EmailSend records")
+        logger.info("📝 Created %s EmailSend records", valid_email_count)
         
         # Create Cloud Tasks for each email with staggered delays
         try:
-            from app.services.task_service import get_tasks_service
             tasks_service = get_tasks_service()
             
-            created_tasks = tasks_service.create_campaign_tasks(
+            created_tasks, failed_ids = tasks_service.create_campaign_tasks(
                 email_send_ids=email_send_ids,
                 delay_min_minutes=campaign.delay_min_minutes or 4,
                 delay_max_minutes=campaign.delay_max_minutes or 7,
@@ -486,11 +745,28 @@ def start_campaign_with_cloud_tasks(campaign_id: int) -> dict:
                 timezone=campaign.timezone or "UTC"
             )
             
-            print(f"✅ Created {len(created_tasks)} Cloud Tasks for campaign {campaign_id}")
+            logger.info("✅ Created %s Cloud Tasks for campaign %s", len(created_tasks), campaign_id)
             
-            # Update campaign statistics
-            campaign.update_statistics(db)
-            db.commit()
+            if failed_ids:
+                if not created_tasks:
+                    raise Exception(f"none of the {len(failed_ids)} tasks could be created")
+                
+                # Nothing will ever process these, so fail them now rather
+                # than leaving the campaign waiting on them
+                logger.warning("⚠️  %s emails could not be queued for campaign %s", len(failed_ids), campaign_id)
+                for start in range(0, len(failed_ids), EMAIL_SEND_INSERT_BATCH_SIZE):
+                    EmailSend.bulk_mark_failed(
+                        db,
+                        failed_ids[start:start + EMAIL_SEND_INSERT_BATCH_SIZE],
+                        "Task creation error: could not queue Cloud Task"
+                    )
+                
+                # Move them from pending to failed relative to the stored
+                # counters, so sends already counted by running tasks aren't
+                # overwritten; completes the campaign if a stats flush
+                # already counted everything else
+                db.execute(campaign_counts_update(campaign_id, sent=0, failed=len(failed_ids)))
+                db.commit()
             
             return {
                 'status': 'success',
@@ -500,9 +776,25 @@ def start_campaign_with_cloud_tasks(campaign_id: int) -> dict:
             }
             
         except Exception as task_error:
-            print(f"❌ Error creating Cloud Tasks: {task_error}")
+            logger.error("❌ Error creating Cloud Tasks: %s", task_error)
             
-            # Mark campaign as failed
+            # Fail every record still waiting on a task in one statement
+            db.execute(
+                update(EmailSend)
+                .where(
+                    EmailSend.campaign_id == campaign_id,
+                    EmailSend.status == EmailStatus.PENDING
+                )
+                .values(
+                    status=EmailStatus.FAILED,
+                    error_message=f"Task creation error: {str(task_error)}"
+                )
+                .execution_options(synchronize_session=False)
+            )
+            
+            # Mark campaign as failed, recounting since it's unknown how far
+            # task creation got
+            campaign.update_statistics(db)
             campaign.status = CampaignStatus.FAILED
             campaign.error_message = f"Task creation error: {str(task_error)}"
             campaign.completed_at = datetime.utcnow()
@@ -514,22 +806,23 @@ def start_campaign_with_cloud_tasks(campaign_id: int) -> dict:
             }
         
     except Exception as e:
-        print(f"❌ Unexpected error starting campaign: {e}")
+        logger.exception("❌ Unexpected error starting campaign: %s", e)
         
         try:
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = db.get(Campaign, campaign_id)
             if campaign:
                 campaign.status = CampaignStatus.FAILED
                 campaign.error_message = str(e)
                 campaign.completed_at = datetime.utcnow()
                 db.commit()
         except Exception as update_error:
-            print(f"❌ Could not update campaign status after error: {update_error}")
+            logger.error("❌ Could not update campaign status after error: %s", update_error)
         
         return {'status': 'error', 'message': str(e)}
         
     finally:
         db.close()
+        response_cache.delete(("campaign", campaign_id))
 
 
 # Root endpoint
@@ -547,82 +840,130 @@ async def root():
 
 
 # Health check endpoints
-@app.get("/api/health", response_model=HealthCheck)
-async def health_check(db: Session = Depends(get_db)):
-    """Comprehensive health check for all services."""
-    try:
-        # Database health
-        db_health = db_manager.health_check()
-        
-        # Google Sheets health
-        sheets_health = {"status": "healthy", "connection": True}
-        try:
-            sheets_service = get_google_sheets_service()
-            # Test with a minimal operation
-            sheets_service.validate_sheet_id("test_validation_12345")
-        except Exception as e:
-            sheets_health = {"status": "unhealthy", "connection": False, "error": str(e)}
-        
-        # Email service health
-        email_health = get_email_service().health_check()
-        
-        # Overall status
-        all_healthy = (
-            db_health["status"] == "healthy" and
-            sheets_health["status"] == "healthy" and
-            email_health["status"] == "healthy"
-        )
-        
-        return HealthCheck(
-            status="healthy" if all_healthy else "unhealthy",
-            timestamp=datetime.utcnow(),
-            version="1.0.0",
-            database=db_health,
-            environment=os.getenv("ENVIRONMENT", "development")
-        )
-        
-    except Exception as e:
+def probe_google_sheets(app: FastAPI) -> Dict[str, Any]:
+    """Check that the Google Sheets service is available."""
+    sheets_service = app.state.google_sheets_service
+    if sheets_service is None:
+        raise Exception("Google Sheets service not available")
+    # Test with a minimal operation
+    sheets_service.validate_sheet_id("test_validation_12345")
+    return {"status": "healthy", "connection": True}
+
+
+def probe_email_service(app: FastAPI) -> Dict[str, Any]:
+    """Check the email service (logs in to the SMTP server)."""
+    if app.state.email_service is None:
+        raise Exception("Email service not available")
+    return app.state.email_service.health_check()
+
+
+async def collect_health(app: FastAPI) -> HealthCheck:
+    """Probe the database, Google Sheets and email services concurrently."""
+    db_health, sheets_health, email_health = await asyncio.gather(
+        run_in_threadpool(db_manager.health_check),
+        run_in_threadpool(probe_google_sheets, app),
+        run_in_threadpool(probe_email_service, app),
+        return_exceptions=True
+    )
+    
+    if isinstance(sheets_health, Exception):
+        sheets_health = {"status": "unhealthy", "connection": False, "error": str(sheets_health)}
+    
+    probe_error = next(
+        (result for result in (db_health, email_health) if isinstance(result, Exception)),
+        None
+    )
+    if probe_error is not None:
         return HealthCheck(
             status="unhealthy",
             timestamp=datetime.utcnow(),
             version="1.0.0",
-            database={"status": "unhealthy", "error": str(e)},
+            database={"status": "unhealthy", "error": str(probe_error)},
             environment=os.getenv("ENVIRONMENT", "development")
         )
+    
+    # Overall status
+    all_healthy = (
+        db_health["status"] == "healthy" and
+        sheets_health["status"] == "healthy" and
+        email_health["status"] == "healthy"
+    )
+    
+    return HealthCheck(
+        status="healthy" if all_healthy else "unhealthy",
+        timestamp=datetime.utcnow(),
+        version="1.0.0",
+        database=db_health,
+        environment=os.getenv("ENVIRONMENT", "development")
+    )
+
+
+async def periodic_health_refresh(app: FastAPI):
+    """Refresh app.state.last_health every HEALTH_REFRESH_INTERVAL seconds."""
+    while True:
+        try:
+            app.state.last_health = await collect_health(app)
+        except Exception as e:
+            logger.warning("⚠️  Health refresh failed: %s", e, exc_info=True)
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
+
+@app.get("/livez")
+async def liveness():
+    """Liveness probe with no dependency checks."""
+    return {"ok": True}
+
+
+@app.get("/api/health", response_model=HealthCheck)
+async def health_check(request: Request):
+    """Comprehensive health check for all services (served from the latest background probe)."""
+    if request.app.state.last_health is None:
+        request.app.state.last_health = await collect_health(request.app)
+    return request.app.state.last_health
 
 
 @app.get("/api/health/database")
-async def database_health():
+def database_health():
     """Database-specific health check."""
     try:
         health = db_manager.health_check()
         status_code = status.HTTP_200_OK if health["status"] == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
-        return JSONResponse(status_code=status_code, content=health)
+        return OrjsonResponse(status_code=status_code, content=health)
     except Exception as e:
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "error": str(e)}
         )
 
 
 @app.get("/api/health/email")
-async def email_health():
+def email_health(request: Request):
     """Email service health check."""
     try:
-        email_svc = get_email_service()
+        email_svc = get_email_service(request)
         health = email_svc.health_check()
         status_code = status.HTTP_200_OK if health["status"] == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
-        return JSONResponse(status_code=status_code, content=health)
+        return OrjsonResponse(status_code=status_code, content=health)
     except Exception as e:
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "error": str(e)}
         )
 
 
+@app.get("/metrics")
+def metrics(request: Request):
+    """In-process cache statistics (entries, hits, misses, hit rate)."""
+    sheets_service = getattr(request.app.state, "google_sheets_service", None)
+    return {
+        "response_cache": response_cache.stats(),
+        "sheets_cache": sheets_service.get_cache_stats() if sheets_service else None
+    }
+
+
 # Google Sheets endpoints
 @app.get("/api/sheets/{sheet_id}/preview", response_model=GoogleSheetPreviewResponse)
-async def preview_google_sheet(
+def preview_google_sheet(
     sheet_id: str,
     sheet_range: str = Query(default="A:Z", description="Sheet range to preview"),
     max_rows: int = Query(default=10, ge=1, le=100, description="Maximum rows to preview"),
@@ -641,15 +982,16 @@ async def preview_google_sheet(
         
     except GoogleSheetsError:
         raise  # Will be handled by custom exception handler
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error previewing sheet")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error previewing sheet: {str(e)}"
+            detail="Unexpected error previewing sheet"
         )
 
 
 @app.post("/api/sheets/{sheet_id}/validate")
-async def validate_google_sheet(
+def validate_google_sheet(
     sheet_id: str,
     sheets_service: GoogleSheetsService = Depends(get_google_sheets_service)
 ):
@@ -692,21 +1034,26 @@ async def validate_google_sheet(
         raise  # Will be handled by custom exception handler
     except HTTPException:
         raise  # Re-raise HTTP exceptions
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error validating sheet")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error validating sheet: {str(e)}"
+            detail="Unexpected error validating sheet"
         )
 
 
 # Campaign CRUD endpoints
 @app.post("/api/campaigns/", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
-async def create_campaign(
+def create_campaign(
     campaign: CampaignCreate,
-    db: Session = Depends(get_db),
     sheets_service: GoogleSheetsService = Depends(get_google_sheets_service)
 ):
-    """Create a new email campaign."""
+    """
+    Create a new email campaign.
+    
+    The Google Sheets checks run before a database session is opened, so no
+    pooled connection is held during the API calls.
+    """
     try:
         # Validate Google Sheet access
         if not sheets_service.test_sheet_access(campaign.google_sheet_id):
@@ -742,52 +1089,64 @@ async def create_campaign(
             emails_pending=sheet_info.valid_emails
         )
         
-        db.add(db_campaign)
-        db.commit()
-        db.refresh(db_campaign)
-        
-        # Convert to response model
-        response_data = db_campaign.__dict__.copy()
-        response_data.update({
-            'success_rate': db_campaign.get_success_rate(),
-            'failure_rate': db_campaign.get_failure_rate(),
-            'is_active': db_campaign.is_active(),
-            'is_completed': db_campaign.is_completed()
-        })
+        with session_scope() as db:
+            db.add(db_campaign)
+            db.flush()  # created_at/updated_at come back with the INSERT (eager_defaults)
         
-        return CampaignResponse(**response_data)
+        return CampaignResponse.model_validate(db_campaign)
         
     except GoogleSheetsError:
         raise  # Will be handled by custom exception handler
     except SQLAlchemyError as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error creating campaign"
         )
-    except Exception as e:
-        db.rollback()
+    except Exception:
+        logger.exception("Unexpected error creating campaign")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error creating campaign: {str(e)}"
+            detail="Unexpected error creating campaign"
         )
 
 
 @app.get("/api/campaigns/", response_model=List[CampaignSummary])
-async def list_campaigns(
-    skip: int = Query(default=0, ge=0, description="Number of campaigns to skip"),
+def list_campaigns(
+    response: Response,
+    skip: int = Query(default=0, ge=0, description="Number of campaigns to skip (ignored when a cursor is given)"),
     limit: int = Query(default=50, ge=1, le=200, description="Number of campaigns to return"),
     status_filter: Optional[str] = Query(default=None, description="Filter by campaign status"),
+    after: Optional[str] = Query(default=None, description="Keyset cursor from the previous page's X-Next-Cursor header"),
     db: Session = Depends(get_db)
 ):
-    """List all campaigns with optional filtering and pagination."""
+    """
+    List all campaigns with optional filtering and pagination, newest first.
+    
+    Full pages carry an X-Next-Cursor header; pass it back as after to fetch
+    the next page with an index seek on (created_at, id) instead of an OFFSET
+    scan.
+    """
     try:
-        query = db.query(Campaign)
+        try:
+            pagination = CursorPaginationParams(after=after, size=limit)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        
+        # Select only the columns CampaignSummary needs (skips the message
+        # body etc.); success_rate is computed by the database
+        query = db.query(
+            Campaign.id, Campaign.name, Campaign.status,
+            Campaign.total_recipients, Campaign.emails_sent, Campaign.emails_failed,
+            Campaign.success_rate, Campaign.created_at, Campaign.completed_at
+        )
         
         # Apply status filter if provided
         if status_filter:
             try:
-                status_enum = CampaignStatus(status_filter.lower())
+                status_enum = parse_status_filter(CampaignStatus, status_filter)
                 query = query.filter(Campaign.status == status_enum)
             except ValueError:
                 raise HTTPException(
@@ -796,71 +1155,73 @@ async def list_campaigns(
                 )
         
         # Apply pagination
-        campaigns = query.order_by(Campaign.created_at.desc()).offset(skip).limit(limit).all()
+        query = query.order_by(Campaign.created_at.desc(), Campaign.id.desc())
+        cursor = pagination.decoded()
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            # Prefer the cursor row's stored timestamp so the comparison never
+            # depends on how the driver formats a bound datetime; fall back to
+            # the cursor's own if that campaign has since been deleted
+            cursor_row = aliased(Campaign)
+            stored_created_at = (
+                select(cursor_row.created_at)
+                .where(cursor_row.id == cursor_id)
+                .scalar_subquery()
+            )
+            query = query.filter(
+                tuple_(Campaign.created_at, Campaign.id)
+                < tuple_(func.coalesce(stored_created_at, cursor_created_at), cursor_id)
+            )
+        else:
+            query = query.offset(skip)
+        rows = query.limit(pagination.size).all()
         
-        # Convert to summary format
-        summaries = []
-        for campaign in campaigns:
-            # Create summary data dictionary with computed fields
-            summary_data = {
-                'id': campaign.id,
-                'name': campaign.name,
-                'status': campaign.status,
-                'total_recipients': campaign.total_recipients,
-                'emails_sent': campaign.emails_sent,
-                'emails_failed': campaign.emails_failed,
-                'success_rate': campaign.get_success_rate(),
-                'created_at': campaign.created_at,
-                'completed_at': campaign.completed_at
-            }
-            summary = CampaignSummary(**summary_data)
-            summaries.append(summary)
+        if len(rows) == pagination.size:
+            response.headers["X-Next-Cursor"] = CursorPaginationParams.encode_cursor(
+                rows[-1].created_at, rows[-1].id
+            )
         
-        return summaries
+        return [CampaignSummary.model_validate(row) for row in rows]
         
     except HTTPException:
         raise
-    except Exception as e:
+    except Exception:
+        logger.exception("Error listing campaigns")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error listing campaigns: {str(e)}"
+            detail="Error listing campaigns"
         )
 
 
 @app.get("/api/campaigns/{campaign_id}", response_model=CampaignResponse)
-async def get_campaign(campaign_id: int, db: Session = Depends(get_db)):
-    """Get a specific campaign by ID."""
-    try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+def get_campaign(campaign_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get a specific campaign by ID (conditional GET via ETag)."""
+    def build():
+        row = db.execute(CAMPAIGN_ROW_BY_ID, {"campaign_id": campaign_id}).first()
         
-        if not campaign:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Campaign not found"
             )
         
-        # Convert to response model with computed fields
-        response_data = campaign.__dict__.copy()
-        response_data.update({
-            'success_rate': campaign.get_success_rate(),
-            'failure_rate': campaign.get_failure_rate(),
-            'is_active': campaign.is_active(),
-            'is_completed': campaign.is_completed()
-        })
-        
-        return CampaignResponse(**response_data)
+        return CampaignResponse.model_validate(row).model_dump_json().encode()
+    
+    try:
+        return cached_json_response(request, ("campaign", campaign_id), build)
         
     except HTTPException:
         raise
-    except Exception as e:
+    except Exception:
+        logger.exception("Error retrieving campaign")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving campaign: {str(e)}"
+            detail="Error retrieving campaign"
         )
 
 
 @app.put("/api/campaigns/{campaign_id}", response_model=CampaignResponse)
-async def update_campaign(
+def update_campaign(
     campaign_id: int,
     campaign_update: CampaignUpdate,
     db: Session = Depends(get_db),
@@ -868,47 +1229,64 @@ async def update_campaign(
 ):
     """Update an existing campaign."""
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        update_data = campaign_update.model_dump(exclude_unset=True)
         
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
+        # Nothing to change: return the campaign as it is
+        if not update_data:
+            row = db.execute(CAMPAIGN_ROW_BY_ID, {"campaign_id": campaign_id}).first()
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Campaign not found"
+                )
+            return CampaignResponse.model_validate(row)
+        
+        # Validate the Google Sheet only if it actually changed
+        new_sheet_id = update_data.get("google_sheet_id")
+        if new_sheet_id:
+            current_sheet_id = db.scalar(CAMPAIGN_SHEET_ID_BY_ID, {"campaign_id": campaign_id})
+            if current_sheet_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Campaign not found"
+                )
+            if new_sheet_id != current_sheet_id:
+                # End the read transaction so the pooled connection isn't
+                # held during the Sheets call
+                db.commit()
+                if not sheets_service.test_sheet_access(new_sheet_id):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Cannot access the specified Google Sheet"
+                    )
+        
+        if update_data.get("status") is not None:
+            update_data["status"] = CampaignStatus(update_data["status"].value)
+        
+        # Apply the update only if the campaign isn't sending or completed,
+        # and read the result back in the same statement
+        row = db.execute(
+            update(Campaign)
+            .where(
+                Campaign.id == campaign_id,
+                Campaign.status.notin_(NON_UPDATABLE_STATUSES)
             )
+            .values(**update_data, updated_at=func.now())
+            .returning(*CAMPAIGN_RESPONSE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).first()
         
-        # Check if campaign can be updated
-        if campaign.status in [CampaignStatus.SENDING, CampaignStatus.COMPLETED]:
+        if row is None:
+            get_campaign_status(db, campaign_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot update campaign that is sending or completed"
             )
         
-        # Validate Google Sheet if changed
-        if campaign_update.google_sheet_id and campaign_update.google_sheet_id != campaign.google_sheet_id:
-            if not sheets_service.test_sheet_access(campaign_update.google_sheet_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot access the specified Google Sheet"
-                )
-        
-        # Update fields
-        update_data = campaign_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(campaign, field, value)
-        
         db.commit()
-        db.refresh(campaign)
-        
-        # Convert to response model
-        response_data = campaign.__dict__.copy()
-        response_data.update({
-            'success_rate': campaign.get_success_rate(),
-            'failure_rate': campaign.get_failure_rate(),
-            'is_active': campaign.is_active(),
-            'is_completed': campaign.is_completed()
-        })
+        response_cache.delete(("campaign", campaign_id))
         
-        return CampaignResponse(**response_data)
+        return CampaignResponse.model_validate(row)
         
     except HTTPException:
         raise
@@ -918,19 +1296,20 @@ async def update_campaign(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error updating campaign"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error updating campaign")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error updating campaign: {str(e)}"
+            detail="Unexpected error updating campaign"
         )
 
 
 @app.delete("/api/campaigns/{campaign_id}")
-async def delete_campaign(campaign_id: int, db: Session = Depends(get_db)):
+def delete_campaign(campaign_id: int, db: Session = Depends(get_db)):
     """Delete a campaign."""
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         
         if not campaign:
             raise HTTPException(
@@ -947,6 +1326,7 @@ async def delete_campaign(campaign_id: int, db: Session = Depends(get_db)):
         
         db.delete(campaign)
         db.commit()
+        response_cache.delete(("campaign", campaign_id))
         
         return SuccessResponse(
             message="Campaign deleted successfully",
@@ -961,61 +1341,70 @@ async def delete_campaign(campaign_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error deleting campaign"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error deleting campaign")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error deleting campaign: {str(e)}"
+            detail="Unexpected error deleting campaign"
         )
 
 
 @app.post("/api/campaigns/{campaign_id}/send")
-async def send_campaign(
+def send_campaign(
     campaign_id: int,
+    background_tasks: BackgroundTasks,
     send_request: CampaignSendRequest = CampaignSendRequest(),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
     db: Session = Depends(get_db)
 ):
-    """Send a campaign (placeholder for background task)."""
+    """
+    Send a campaign.
+    
+    The status change is committed before responding; reading the sheet,
+    creating EmailSend records and queueing Cloud Tasks run after the
+    response is sent (in the threadpool, as the task is a plain function).
+    """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-        
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
+        new_status = CampaignStatus.SCHEDULED if not send_request.send_immediately else CampaignStatus.SENDING
+        now = datetime.utcnow()
+        
+        # Update campaign status, only from a sendable status
+        result = db.execute(
+            update(Campaign)
+            .where(
+                Campaign.id == campaign_id,
+                Campaign.status.in_(SENDABLE_STATUSES)
+            )
+            .values(
+                status=new_status,
+                started_at=now if send_request.send_immediately else None
             )
+            .execution_options(synchronize_session=False)
+        )
         
-        # Check if campaign can be sent
-        if campaign.status not in [CampaignStatus.DRAFT, CampaignStatus.SCHEDULED]:
+        if result.rowcount == 0:
+            get_campaign_status(db, campaign_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Campaign cannot be sent in current status"
             )
         
-        # Update campaign status
-        campaign.status = CampaignStatus.SCHEDULED if not send_request.send_immediately else CampaignStatus.SENDING
-        campaign.started_at = datetime.utcnow() if send_request.send_immediately else None
-        
         db.commit()
+        response_cache.delete(("campaign", campaign_id))
         
-        # Use Cloud Tasks for all campaign processing (immediate and scheduled)
-        result = start_campaign_with_cloud_tasks(campaign_id)
-        if result['status'] == 'error':
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error starting campaign: {result['message']}"
-            )
+        # Use Cloud Tasks for all campaign processing (immediate and scheduled).
+        # Failures are recorded on the campaign (status FAILED + error_message)
+        background_tasks.add_task(start_campaign_with_cloud_tasks, campaign_id)
         
         return SuccessResponse(
             message=f"Campaign {'scheduled' if not send_request.send_immediately else 'started'} successfully",
             data={
                 "campaign_id": campaign_id,
-                "status": campaign.status.value,
+                "status": new_status.value,
                 "test_mode": send_request.test_mode,
                 "send_immediately": send_request.send_immediately
             },
-            timestamp=datetime.utcnow()
+            timestamp=now
         )
         
     except HTTPException:
@@ -1026,50 +1415,53 @@ async def send_campaign(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error updating campaign status"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error sending campaign")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error sending campaign: {str(e)}"
+            detail="Unexpected error sending campaign"
         )
 
 
 @app.post("/api/campaigns/{campaign_id}/stop")
-async def stop_campaign(
+def stop_campaign(
     campaign_id: int,
     db: Session = Depends(get_db)
 ):
     """Stop a currently sending campaign."""
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-        
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
+        # Cancel the campaign only if it is sending or scheduled
+        now = datetime.utcnow()
+        row = db.execute(
+            update(Campaign)
+            .where(
+                Campaign.id == campaign_id,
+                Campaign.status.in_(STOPPABLE_STATUSES)
             )
+            .values(status=CampaignStatus.CANCELLED, completed_at=now)
+            .returning(Campaign.name)
+            .execution_options(synchronize_session=False)
+        ).first()
         
-        # Check if campaign can be stopped
-        if campaign.status not in [CampaignStatus.SENDING, CampaignStatus.SCHEDULED]:
+        if row is None:
+            campaign_status = get_campaign_status(db, campaign_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Campaign is not currently sending (status: {campaign.status.value})"
+                detail=f"Campaign is not currently sending (status: {campaign_status.value})"
             )
         
-        # Update campaign status to cancelled
-        campaign.status = CampaignStatus.CANCELLED
-        campaign.completed_at = datetime.utcnow()
-        
         db.commit()
+        response_cache.delete(("campaign", campaign_id))
         
         return SuccessResponse(
-            message=f"Campaign '{campaign.name}' stopped successfully",
+            message=f"Campaign '{row.name}' stopped successfully",
             data={
                 "campaign_id": campaign_id,
-                "status": campaign.status.value,
-                "stopped_at": campaign.completed_at.isoformat()
+                "status": CampaignStatus.CANCELLED.value,
+                "stopped_at": now.isoformat()
             },
-            timestamp=datetime.utcnow()
+            timestamp=now
         )
         
     except HTTPException:
@@ -1080,39 +1472,45 @@ async def stop_campaign(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error stopping campaign"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error stopping campaign")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error stopping campaign: {str(e)}"
+            detail="Unexpected error stopping campaign"
         )
 
 
 @app.get("/api/campaigns/{campaign_id}/emails", response_model=List[EmailSendResponse])
-async def get_campaign_emails(
+def get_campaign_emails(
     campaign_id: int,
-    skip: int = Query(default=0, ge=0),
+    skip: int = Query(default=0, ge=0, description="Offset pagination (ignored when a keyset cursor is given)"),
     limit: int = Query(default=50, ge=1, le=200),
     status_filter: Optional[str] = Query(default=None),
+    after_id: Optional[int] = Query(default=None, description="Keyset cursor: id of the last email on the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get email sends for a specific campaign."""
+    """
+    Get email sends for a specific campaign, newest first.
+    
+    Pass the id of the last row as after_id to fetch the next page with an
+    index seek on (created_at, id) instead of an OFFSET scan.
+    """
     try:
         # Verify campaign exists
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-        if not campaign:
+        if db.scalar(CAMPAIGN_EXISTS_BY_ID, {"campaign_id": campaign_id}) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Campaign not found"
             )
         
-        # Query email sends
-        query = db.query(EmailSend).filter(EmailSend.campaign_id == campaign_id)
+        # Query only the EmailSendResponse columns as plain rows
+        query = db.query(*EMAIL_SEND_RESPONSE_COLUMNS).filter(EmailSend.campaign_id == campaign_id)
         
         # Apply status filter if provided
         if status_filter:
             try:
-                status_enum = EmailStatus(status_filter.lower())
+                status_enum = parse_status_filter(EmailStatus, status_filter)
                 query = query.filter(EmailSend.status == status_enum)
             except ValueError:
                 raise HTTPException(
@@ -1121,54 +1519,67 @@ async def get_campaign_emails(
                 )
         
         # Apply pagination
-        email_sends = query.order_by(EmailSend.created_at.desc()).offset(skip).limit(limit).all()
+        query = query.order_by(EmailSend.created_at.desc(), EmailSend.id.desc())
+        if after_id is not None:
+            # Compare against the cursor row's stored key so timestamps never
+            # round-trip through Python
+            cursor_row = aliased(EmailSend)
+            cursor_key = (
+                select(cursor_row.created_at, cursor_row.id)
+                .where(cursor_row.id == after_id)
+                .scalar_subquery()
+            )
+            query = query.filter(tuple_(EmailSend.created_at, EmailSend.id) < cursor_key)
+        else:
+            query = query.offset(skip)
+        rows = query.limit(limit).all()
         
-        return [EmailSendResponse.model_validate(email_send) for email_send in email_sends]
+        # Serialize the rows directly; the columns already match EmailSendResponse
+        return OrjsonResponse([row._asdict() for row in rows])
         
     except HTTPException:
         raise
-    except Exception as e:
+    except Exception:
+        logger.exception("Error retrieving campaign emails")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving campaign emails: {str(e)}"
+            detail="Error retrieving campaign emails"
         )
 
 
 # Email Template CRUD endpoints
 @app.get("/api/templates/", response_model=List[EmailTemplateSummary])
-async def list_templates(
+def list_templates(
     skip: int = Query(default=0, ge=0, description="Number of templates to skip"),
     limit: int = Query(default=50, ge=1, le=200, description="Number of templates to return"),
     db: Session = Depends(get_db)
 ):
     """List all email templates with pagination."""
     try:
-        query = db.query(EmailTemplate)
-        templates = query.order_by(EmailTemplate.created_at.desc()).offset(skip).limit(limit).all()
+        # Select only the summary columns (skips the subject/message text)
+        rows = db.execute(
+            select(
+                EmailTemplate.id, EmailTemplate.name, EmailTemplate.description,
+                EmailTemplate.created_at, EmailTemplate.variables_count
+            )
+            .order_by(EmailTemplate.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        ).all()
         
         # Convert to summary format
-        summaries = []
-        for template in templates:
-            summary_data = {
-                'id': template.id,
-                'name': template.name,
-                'description': template.description,
-                'created_at': template.created_at,
-                'variables_count': len(template.get_variables_list()) if template.variables else 0
-            }
-            summaries.append(EmailTemplateSummary(**summary_data))
-        
-        return summaries
+        return [EmailTemplateSummary.model_validate(row) for row in rows]
         
-    except Exception as e:
+    except Exception:
+        logger.exception("Error listing templates")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error listing templates: {str(e)}"
+            detail="Error listing templates"
         )
 
 
 @app.post("/api/templates/", response_model=EmailTemplateResponse, status_code=status.HTTP_201_CREATED)
-async def create_template(
+def create_template(
     template: EmailTemplateCreate,
     db: Session = Depends(get_db)
 ):
@@ -1184,14 +1595,9 @@ async def create_template(
         )
         
         db.add(db_template)
-        db.commit()
-        db.refresh(db_template)
+        db.commit()  # created_at/updated_at come back with the INSERT (eager_defaults)
         
-        # Convert to response model
-        response_data = db_template.__dict__.copy()
-        response_data['variables_list'] = db_template.get_variables_list()
-        
-        return EmailTemplateResponse(**response_data)
+        return EmailTemplateResponse.model_validate(db_template)
         
     except SQLAlchemyError as e:
         db.rollback()
@@ -1199,19 +1605,20 @@ async def create_template(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error creating template"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error creating template")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error creating template: {str(e)}"
+            detail="Unexpected error creating template"
         )
 
 
 @app.get("/api/templates/{template_id}", response_model=EmailTemplateResponse)
-async def get_template(template_id: int, db: Session = Depends(get_db)):
-    """Get a specific email template by ID."""
-    try:
-        template = db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
+def get_template(template_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get a specific email template by ID (conditional GET via ETag)."""
+    def build():
+        template = db.get(EmailTemplate, template_id)
         
         if not template:
             raise HTTPException(
@@ -1219,30 +1626,30 @@ async def get_template(template_id: int, db: Session = Depends(get_db)):
                 detail="Template not found"
             )
         
-        # Convert to response model
-        response_data = template.__dict__.copy()
-        response_data['variables_list'] = template.get_variables_list()
-        
-        return EmailTemplateResponse(**response_data)
+        return EmailTemplateResponse.model_validate(template).model_dump_json().encode()
+    
+    try:
+        return cached_json_response(request, ("template", template_id), build)
         
     except HTTPException:
         raise
-    except Exception as e:
+    except Exception:
+        logger.exception("Error retrieving template")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving template: {str(e)}"
+            detail="Error retrieving template"
         )
 
 
 @app.put("/api/templates/{template_id}", response_model=EmailTemplateResponse)
-async def update_template(
+def update_template(
     template_id: int,
     template_update: EmailTemplateUpdate,
     db: Session = Depends(get_db)
 ):
     """Update an existing email template."""
     try:
-        template = db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
+        template = db.get(EmailTemplate, template_id)
         
         if not template:
             raise HTTPException(
@@ -1257,13 +1664,9 @@ async def update_template(
         
         template.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(template)
+        response_cache.delete(("template", template_id))
         
-        # Convert to response model
-        response_data = template.__dict__.copy()
-        response_data['variables_list'] = template.get_variables_list()
-        
-        return EmailTemplateResponse(**response_data)
+        return EmailTemplateResponse.model_validate(template)
         
     except HTTPException:
         raise
@@ -1273,19 +1676,20 @@ async def update_template(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error updating template"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error updating template")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error updating template: {str(e)}"
+            detail="Unexpected error updating template"
         )
 
 
 @app.delete("/api/templates/{template_id}")
-async def delete_template(template_id: int, db: Session = Depends(get_db)):
+def delete_template(template_id: int, db: Session = Depends(get_db)):
     """Delete an email template."""
     try:
-        template = db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
+        template = db.get(EmailTemplate, template_id)
         
         if not template:
             raise HTTPException(
@@ -1295,6 +1699,7 @@ async def delete_template(template_id: int, db: Session = Depends(get_db)):
         
         db.delete(template)
         db.commit()
+        response_cache.delete(("template", template_id))
         
         return SuccessResponse(
             message="Template deleted successfully",
@@ -1309,11 +1714,12 @@ async def delete_template(template_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error deleting template"
         )
-    except Exception as e:
+    except Exception:
+        logger.exception("Unexpected error deleting template")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error deleting template: {str(e)}"
+            detail="Unexpected error deleting template"
         )
 
 
@@ -1321,6 +1727,21 @@ async def delete_template(template_id: int, db: Session = Depends(get_db)):
 # CLOUD TASKS ENDPOINTS
 # ============================================================================
 
+def process_email_task(app: FastAPI, email_send_id: int) -> dict:
+    """Send one email and queue its outcome for the campaign statistics."""
+    result = send_single_email_task(email_send_id, rate_limited=True)
+    
+    # Queue the outcome for the batched campaign statistics update (the
+    # campaign is marked completed once no emails are pending)
+    if 'campaign_id' in result:
+        app.state.campaign_stats_buffer.record(
+            result['campaign_id'],
+            sent=result['status'] == 'success'
+        )
+    
+    return result
+
+
 @app.post("/api/tasks/send-email")
 async def handle_send_email_task(request: Request):
     """
@@ -1340,58 +1761,36 @@ async def handle_send_email_task(request: Request):
                 "message": "Missing email_send_id in payload"
             }
         
-        # Send the email using our helper function
-        result = send_single_email_task(email_send_id)
+        # Wait out the send rate limit here, before taking a worker thread or
+        # a database connection, so a burst of tasks doesn't starve the API
+        email_service = getattr(request.app.state, "email_service", None)
+        if email_service:
+            wait = email_service.reserve_send()
+            if wait > 0:
+                await asyncio.sleep(wait)
         
-        # Update campaign statistics after processing email
-        if result['status'] in ['success', 'failed']:
-            try:
-                db = db_manager.get_session()
-                
-                # Get the email record to find campaign
-                email_send = db.query(EmailSend).filter(EmailSend.id == email_send_id).first()
-                if email_send:
-                    campaign = db.query(Campaign).filter(Campaign.id == email_send.campaign_id).first()
-                    if campaign:
-                        # Update campaign statistics
-                        campaign.update_statistics(db)
-                        
-                        # Check if campaign is complete
-                        if campaign.emails_pending == 0:
-                            campaign.status = CampaignStatus.COMPLETED
-                            campaign.completed_at = datetime.utcnow()
-                            print(f"🎉 Campaign {campaign.id} ({campaign.name}) completed!")
-                        
-                        db.commit()
-                        print(f"📊 Updated statistics for campaign {campaign.id}")
-                
-                db.close()
-                
-            except Exception as stats_error:
-                print(f"⚠️ Error updating campaign statistics: {stats_error}")
-        
-        return result
+        # SMTP and database work block, so run it in the threadpool to keep
+        # the event loop free for other in-flight tasks; the session is
+        # opened there, once the wait is over
+        return await run_in_threadpool(process_email_task, request.app, email_send_id)
         
     except json.JSONDecodeError:
         return {
             "status": "error", 
             "message": "Invalid JSON payload"
         }
-    except Exception as e:
-        error_msg = f"Error processing email task: {str(e)}"
-        print(f"❌ {error_msg}")
+    except Exception:
+        logger.exception("❌ Error processing email task")
         return {
             "status": "error", 
-            "message": error_msg
+            "message": "Error processing email task"
         }
 
 
 @app.get("/api/tasks/health")
-async def tasks_health_check():
+def tasks_health_check():
     """Health check endpoint for Cloud Tasks queue."""
     try:
-        from app.services.task_service import get_tasks_service
-        
         tasks_service = get_tasks_service()
         queue_info = tasks_service.get_queue_info()
         
@@ -1410,10 +1809,16 @@ async def tasks_health_check():
 
 # Development server entry point
 if __name__ == "__main__":
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"   # Default to false for production
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", os.getenv("API_PORT", "8000"))),  # Check PORT first, then API_PORT
-        reload=os.getenv("API_RELOAD", "false").lower() == "true",   # Default to false for production
+        reload=reload,
+        # Each worker runs its own lifespan, services, DB pool and send rate
+        # limiter, so one by default; see WEB_CONCURRENCY in .env.example
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",  # uvloop when installed (uvicorn[standard])
+        http="auto",  # httptools when installed (uvicorn[standard])
         log_level="info"
     )
\ No newline at end of file
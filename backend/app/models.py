@@ -7,19 +7,26 @@ relationships, indexes, and constraints.
 
 from datetime import datetime
 from enum import Enum as PyEnum
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, 
-    String, Text, Index, event, func
+    Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, 
+    SmallInteger, String, Text, Index, bindparam, case, cast, func, select, update
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship, validates
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
 
-class CampaignStatus(PyEnum):
-    """Campaign status enumeration."""
+class CampaignStatus(str, PyEnum):
+    """
+    Campaign status enumeration.
+    
+    A str subclass, so members compare equal to their values ("sending") and
+    API schemas validate them without an enum-to-enum conversion.
+    """
     DRAFT = "draft"
     SCHEDULED = "scheduled"
     SENDING = "sending"
@@ -28,8 +35,17 @@ class CampaignStatus(PyEnum):
     CANCELLED = "cancelled"
 
 
-class EmailStatus(PyEnum):
-    """Email send status enumeration."""
+# Statuses reported by Campaign.is_active() / is_completed()
+ACTIVE_CAMPAIGN_STATUSES = frozenset({CampaignStatus.SCHEDULED, CampaignStatus.SENDING})
+COMPLETED_CAMPAIGN_STATUSES = frozenset({
+    CampaignStatus.COMPLETED,
+    CampaignStatus.FAILED,
+    CampaignStatus.CANCELLED
+})
+
+
+class EmailStatus(str, PyEnum):
+    """Email send status enumeration (a str subclass, like CampaignStatus)."""
     PENDING = "pending"
     SENT = "sent"
     FAILED = "failed"
@@ -46,6 +62,9 @@ class Campaign(Base):
     """
     
     __tablename__ = "campaigns"
+    # Fetch server-generated columns (created_at, updated_at) in the INSERT/
+    # UPDATE itself rather than with a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -62,26 +81,36 @@ class Campaign(Base):
     google_sheet_id = Column(String(100), nullable=False, index=True)
     google_sheet_range = Column(String(50), default="A:Z")
     
-    # Campaign status and metadata
+    # Campaign status and metadata (indexed by ix_campaigns_status_created_at)
     status = Column(
         Enum(CampaignStatus), 
         default=CampaignStatus.DRAFT, 
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Email statistics
     total_recipients = Column(Integer, default=0)
     emails_sent = Column(Integer, default=0)
     emails_failed = Column(Integer, default=0)
+    # Stored rather than derived as total - sent - failed: skipped (cancelled)
+    # and bounced sends count towards the total but aren't pending, and
+    # CampaignStatsBuffer decrements it to detect completion in one UPDATE
     emails_pending = Column(Integer, default=0)
     
-    # Timestamps
+    # Percentage of recipients sent, computed in SQL so list queries can
+    # select (and order by) it without loading the counters into Python
+    success_rate = column_property(
+        case(
+            (func.coalesce(total_recipients, 0) == 0, 0.0),
+            else_=cast(func.coalesce(emails_sent, 0), Float) * 100.0 / total_recipients
+        )
+    )
+    
+    # Timestamps (created_at is indexed by the composite indexes below)
     created_at = Column(
         DateTime(timezone=True), 
         server_default=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
     updated_at = Column(
         DateTime(timezone=True), 
@@ -96,25 +125,30 @@ class Campaign(Base):
     # Configuration
     send_immediately = Column(Boolean, default=True)
     use_delay = Column(Boolean, default=False)
-    delay_min_minutes = Column(Integer, default=4)
-    delay_max_minutes = Column(Integer, default=7)
+    delay_min_minutes = Column(SmallInteger, default=4)
+    delay_max_minutes = Column(SmallInteger, default=7)
     
     # Business hours configuration
     respect_business_hours = Column(Boolean, default=False)
-    business_hours_start = Column(Integer, default=7)  # 7 AM (24-hour format)
-    business_hours_end = Column(Integer, default=17)   # 5 PM (24-hour format)
+    business_hours_start = Column(SmallInteger, default=7)  # 7 AM (24-hour format)
+    business_hours_end = Column(SmallInteger, default=17)   # 5 PM (24-hour format)
     business_days_only = Column(Boolean, default=True)  # Monday-Friday only
     timezone = Column(String(50), default="UTC")  # Timezone for business hours
     
     # Error tracking
     error_message = Column(Text, nullable=True)
-    error_count = Column(Integer, default=0)
+    error_count = Column(SmallInteger, default=0)
     
     # Relationships
+    # Deleting a campaign leaves its email sends to the database's ON DELETE
+    # CASCADE instead of loading them all; they're never read through this
+    # collection, so an accidental lazy load raises
     email_sends = relationship(
         "EmailSend", 
         back_populates="campaign",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
     )
     
     def __repr__(self):
@@ -138,40 +172,52 @@ class Campaign(Base):
     
     def is_active(self):
         """Check if campaign is currently active (sending)."""
-        active_statuses = [CampaignStatus.SCHEDULED, CampaignStatus.SENDING]
-        return self.status in active_statuses
+        return self.status in ACTIVE_CAMPAIGN_STATUSES
     
     def is_completed(self):
         """Check if campaign is completed (success or failure)."""
-        completed_statuses = [
-            CampaignStatus.COMPLETED, 
-            CampaignStatus.FAILED, 
-            CampaignStatus.CANCELLED
-        ]
-        return self.status in completed_statuses
+        return self.status in COMPLETED_CAMPAIGN_STATUSES
     
     def update_statistics(self, session):
-        """Update campaign statistics based on email sends."""
-        # Count emails by status
-        total_count = session.query(EmailSend).filter(EmailSend.campaign_id == self.id).count()
-        sent_count = session.query(EmailSend).filter(
-            EmailSend.campaign_id == self.id,
-            EmailSend.status == EmailStatus.SENT
-        ).count()
-        failed_count = session.query(EmailSend).filter(
-            EmailSend.campaign_id == self.id,
-            EmailSend.status == EmailStatus.FAILED
-        ).count()
-        pending_count = session.query(EmailSend).filter(
-            EmailSend.campaign_id == self.id,
-            EmailSend.status == EmailStatus.PENDING
-        ).count()
+        """
+        Recompute campaign statistics from scratch based on email sends.
+        
+        The counters are normally maintained incrementally as emails are
+        queued and sent; this is for when they can't be trusted (e.g. a
+        failed start). Only rows already in the database are counted:
+        EmailSend rows are written with Core statements, so nothing pending
+        in the session affects the counts.
+        
+        Args:
+            session: Database session
+        """
+        # Count emails by status in one grouped query; the query only reads
+        # email_sends, so don't flush pending campaign changes for it (they go
+        # out once, at commit)
+        with session.no_autoflush:
+            counts = dict(session.execute(EMAIL_STATUS_COUNTS, {"campaign_id": self.id}).all())
         
         # Update statistics
-        self.total_recipients = total_count
-        self.emails_sent = sent_count
-        self.emails_failed = failed_count
-        self.emails_pending = pending_count
+        self.total_recipients = sum(counts.values())
+        self.emails_sent = counts.get(EmailStatus.SENT, 0)
+        self.emails_failed = counts.get(EmailStatus.FAILED, 0)
+        self.emails_pending = counts.get(EmailStatus.PENDING, 0)
+
+
+# Serves list_campaigns' status filter and newest-first ordering from one index
+Index(
+    "ix_campaigns_status_created_at",
+    Campaign.status,
+    Campaign.created_at.desc()
+)
+
+# Serves the unfiltered campaign list, newest first, and its (created_at, id)
+# keyset pagination
+Index(
+    "ix_campaigns_created_at_id",
+    Campaign.created_at.desc(),
+    Campaign.id.desc()
+)
 
 
 class EmailTemplate(Base):
@@ -182,6 +228,7 @@ class EmailTemplate(Base):
     """
     
     __tablename__ = "email_templates"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -196,6 +243,9 @@ class EmailTemplate(Base):
     
     # Template metadata
     variables = Column(Text, nullable=True)  # Comma-separated list of variables
+    # Number of names in variables, kept in sync by _count_variables so the
+    # template list reads it directly instead of parsing every row
+    variables_count = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Timestamps
     created_at = Column(
@@ -214,12 +264,35 @@ class EmailTemplate(Base):
     def __repr__(self):
         return f"<EmailTemplate(id={self.id}, name='{self.name}')>"
     
+    @validates('variables')
+    def _count_variables(self, key, variables):
+        """Update variables_count whenever variables is assigned."""
+        self.variables_count = len(split_template_variables(variables))
+        return variables
+    
     def get_variables_list(self):
         """Get template variables as a list."""
-        variables_str = getattr(self, 'variables', None)
-        if not variables_str:
-            return []
-        return [var.strip() for var in variables_str.split(',') if var.strip()]
+        return list(split_template_variables(getattr(self, 'variables', None)))
+
+
+@lru_cache(maxsize=1024)
+def split_template_variables(variables: Optional[str]) -> Tuple[str, ...]:
+    """
+    Split a template's comma-separated variables string.
+    
+    Memoized on the string, so listing or re-reading unchanged templates
+    doesn't parse it again. Returns a tuple so cached results can't be mutated.
+    
+    Args:
+        variables: Comma-separated variable names, or None
+        
+    Returns:
+        Tuple of stripped, non-empty variable names
+    """
+    if not variables:
+        return ()
+    stripped = (var.strip() for var in variables.split(','))
+    return tuple(var for var in stripped if var)
 
 
 class EmailSend(Base):
@@ -231,16 +304,17 @@ class EmailSend(Base):
     """
     
     __tablename__ = "email_sends"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
     
-    # Foreign key to campaign
+    # Foreign key to campaign (lookups by campaign use the composite
+    # indexes below, which all lead with campaign_id)
     campaign_id = Column(
         Integer, 
         ForeignKey("campaigns.id", ondelete="CASCADE"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Recipient information
@@ -260,8 +334,8 @@ class EmailSend(Base):
     )
     
     # Send attempts and timing
-    send_attempts = Column(Integer, default=0)
-    max_send_attempts = Column(Integer, default=3)
+    send_attempts = Column(SmallInteger, default=0)
+    max_send_attempts = Column(SmallInteger, default=3)
     
     # Timestamps
     created_at = Column(
@@ -318,16 +392,68 @@ class EmailSend(Base):
         """Mark email as skipped."""
         self.status = EmailStatus.SKIPPED
         self.error_message = f"Skipped: {reason}"
+    
+    @classmethod
+    def bulk_mark_sent(cls, session, ids, smtp_response=None):
+        """
+        Mark many emails as sent with a single UPDATE.
+        
+        Args:
+            session: Database session
+            ids: EmailSend IDs to update
+            smtp_response: Optional SMTP response stored on every row
+        """
+        values = {"status": EmailStatus.SENT, "sent_at": func.now()}
+        if smtp_response:
+            values["smtp_response"] = smtp_response
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @classmethod
+    def bulk_mark_failed(cls, session, ids, error_message):
+        """
+        Mark many emails as failed with a single UPDATE.
+        
+        Unlike mark_as_failed, send_attempts is left alone: this is for
+        emails that failed before a send was attempted.
+        
+        Args:
+            session: Database session
+            ids: EmailSend IDs to update
+            error_message: Error message stored on every row
+        """
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(status=EmailStatus.FAILED, error_message=error_message)
+            .execution_options(synchronize_session=False)
+        )
 
 
-# SQLAlchemy event listeners for automatic timestamp updates
-@event.listens_for(Campaign, 'before_update')
-def campaign_before_update(mapper, connection, target):
-    """Update campaign updated_at timestamp before update."""
-    target.updated_at = datetime.utcnow()
+# Per-status email counts for Campaign.update_statistics, built once and
+# executed with a campaign_id parameter
+EMAIL_STATUS_COUNTS = (
+    select(EmailSend.status, func.count())
+    .where(EmailSend.campaign_id == bindparam("campaign_id"))
+    .group_by(EmailSend.status)
+)
 
 
-@event.listens_for(EmailSend, 'before_update')
-def email_send_before_update(mapper, connection, target):
-    """Update email_send updated_at timestamp before update."""
-    target.updated_at = datetime.utcnow()
\ No newline at end of file
+# Serves keyset pagination of a campaign's email sends, newest first
+Index(
+    "ix_email_sends_campaign_created_at_id",
+    EmailSend.campaign_id,
+    EmailSend.created_at.desc(),
+    EmailSend.id.desc()
+)
+
+# Serves the per-status counts in update_statistics and status-filtered email lists
+Index(
+    "ix_email_sends_campaign_status",
+    EmailSend.campaign_id,
+    EmailSend.status
+)
@@ -4,13 +4,29 @@ Pydantic schemas for Email Campaign App.
 Defines request/response models for API validation and serialization.
 """
 
+import base64
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Generic, List, Optional, Tuple, TypeVar
 from enum import Enum
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, ValidationInfo, computed_field, field_validator
 from pydantic.config import ConfigDict
 
+from app.models import split_template_variables
+from app.utils.email_address import is_email_shaped
+
+
+# Shared by the schemas built from ORM rows. Responses are never modified after
+# they are built, so they are frozen; extra keys and unset defaults are
+# spelled out as ignored / not validated so nothing adds per-field checks
+RESPONSE_MODEL_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    validate_default=False,
+    frozen=True
+)
+
 
 class CampaignStatusEnum(str, Enum):
     """Campaign status enumeration for API."""
@@ -22,6 +38,15 @@ class CampaignStatusEnum(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses behind CampaignResponse.is_active / is_completed
+ACTIVE_STATUSES = frozenset({CampaignStatusEnum.SCHEDULED, CampaignStatusEnum.SENDING})
+COMPLETED_STATUSES = frozenset({
+    CampaignStatusEnum.COMPLETED,
+    CampaignStatusEnum.FAILED,
+    CampaignStatusEnum.CANCELLED
+})
+
+
 class EmailStatusEnum(str, Enum):
     """Email send status enumeration for API."""
     PENDING = "pending"
@@ -31,6 +56,11 @@ class EmailStatusEnum(str, Enum):
     SKIPPED = "skipped"
 
 
+# Google Sheets IDs are URL-safe base64: letters, digits, "-" and "_"
+# (length is enforced by the field constraints)
+SHEET_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
 # Base schemas
 class CampaignBase(BaseModel):
     """Base schema for Campaign."""
@@ -52,36 +82,39 @@ class CampaignBase(BaseModel):
     business_days_only: bool = Field(default=True, description="Only send on Monday-Friday")
     timezone: str = Field(default="UTC", description="Timezone for business hours")
     
-    @validator('delay_max_minutes')
-    def validate_delay_range(cls, v, values):
+    @field_validator('delay_max_minutes', mode='after')
+    @classmethod
+    def validate_delay_range(cls, v, info: ValidationInfo):
         """Validate that max delay is greater than min delay."""
-        if 'delay_min_minutes' in values and v < values['delay_min_minutes']:
+        if 'delay_min_minutes' in info.data and v < info.data['delay_min_minutes']:
             raise ValueError('delay_max_minutes must be greater than or equal to delay_min_minutes')
         return v
     
-    @validator('business_hours_end')
-    def validate_business_hours(cls, v, values):
+    @field_validator('business_hours_end', mode='after')
+    @classmethod
+    def validate_business_hours(cls, v, info: ValidationInfo):
         """Validate that business hours end is after start."""
-        if 'business_hours_start' in values and v <= values['business_hours_start']:
+        if 'business_hours_start' in info.data and v <= info.data['business_hours_start']:
             raise ValueError('business_hours_end must be greater than business_hours_start')
         return v
     
-    @validator('google_sheet_id')
+    @field_validator('google_sheet_id', mode='after')
+    @classmethod
     def validate_google_sheet_id(cls, v):
         """Validate Google Sheets ID format."""
-        if not v or len(v) < 10:
-            raise ValueError('Google Sheets ID must be at least 10 characters')
         # Basic format validation (Google Sheets IDs are typically 44 characters)
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not SHEET_ID_PATTERN.fullmatch(v):
             raise ValueError('Invalid Google Sheets ID format')
         return v
     
-    @validator('message')
+    @field_validator('message', mode='after')
+    @classmethod
     def validate_message(cls, v):
         """Validate email message content."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Email message cannot be empty')
-        return v.strip()
+        return v
 
 
 class CampaignCreate(CampaignBase):
@@ -114,7 +147,7 @@ class CampaignUpdate(BaseModel):
 
 class CampaignResponse(CampaignBase):
     """Schema for campaign response."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
     
     id: int
     status: CampaignStatusEnum
@@ -130,16 +163,40 @@ class CampaignResponse(CampaignBase):
     error_message: Optional[str] = None
     error_count: int
     
-    # Computed fields
-    success_rate: Optional[float] = None
-    failure_rate: Optional[float] = None
-    is_active: Optional[bool] = None
-    is_completed: Optional[bool] = None
+    # Computed fields (derived from the columns above, so the response can be
+    # built directly from the ORM object with model_validate)
+    @computed_field
+    @property
+    def success_rate(self) -> float:
+        """Percentage of recipients sent successfully."""
+        if not self.total_recipients:
+            return 0.0
+        return (self.emails_sent / self.total_recipients) * 100
+    
+    @computed_field
+    @property
+    def failure_rate(self) -> float:
+        """Percentage of recipients that failed."""
+        if not self.total_recipients:
+            return 0.0
+        return (self.emails_failed / self.total_recipients) * 100
+    
+    @computed_field
+    @property
+    def is_active(self) -> bool:
+        """Whether the campaign is scheduled or sending."""
+        return self.status in ACTIVE_STATUSES
+    
+    @computed_field
+    @property
+    def is_completed(self) -> bool:
+        """Whether the campaign has finished (completed, failed or cancelled)."""
+        return self.status in COMPLETED_STATUSES
 
 
 class CampaignSummary(BaseModel):
     """Schema for campaign summary (list view)."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
     
     id: int
     name: str
@@ -155,12 +212,24 @@ class CampaignSummary(BaseModel):
 # Email Send schemas
 class EmailSendBase(BaseModel):
     """Base schema for EmailSend."""
-    recipient_email: EmailStr = Field(..., description="Recipient email address")
+    # Addresses are fully validated and normalized when imported from the
+    # sheet, so only their shape is re-checked here (see validate_recipient_email)
+    recipient_email: str = Field(..., max_length=255, description="Recipient email address")
     recipient_name: Optional[str] = Field(None, max_length=255, description="Recipient name")
     personalized_subject: str = Field(..., max_length=500, description="Personalized email subject")
     personalized_message: str = Field(..., description="Personalized email message")
 
 
+    @field_validator('recipient_email', mode='after')
+    @classmethod
+    def validate_recipient_email(cls, v: str) -> str:
+        """Strip the address and check it looks like one."""
+        v = v.strip()
+        if not is_email_shaped(v):
+            raise ValueError('Invalid email address')
+        return v
+
+
 class EmailSendCreate(EmailSendBase):
     """Schema for creating a new email send record."""
     campaign_id: int = Field(..., description="Campaign ID")
@@ -177,7 +246,7 @@ class EmailSendUpdate(BaseModel):
 
 class EmailSendResponse(EmailSendBase):
     """Schema for email send response."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
     
     id: int
     campaign_id: int
@@ -262,9 +331,76 @@ class PaginationParams(BaseModel):
     sort_order: Optional[str] = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
 
 
-class PaginatedResponse(BaseModel):
-    """Schema for paginated responses."""
-    items: List[BaseModel]
+class CursorPaginationParams(BaseModel):
+    """
+    Schema for keyset pagination parameters.
+    
+    The cursor is an opaque base64 token of the last row's created_at and id;
+    the next page continues strictly after it in (created_at, id) DESC order,
+    so every page costs the same index seek however deep it is.
+    """
+    after: Optional[str] = Field(default=None, description="Cursor from the previous page")
+    size: int = Field(default=50, ge=1, le=200, description="Page size")
+    
+    @field_validator('after', mode='after')
+    @classmethod
+    def validate_cursor(cls, v: Optional[str]) -> Optional[str]:
+        """Reject cursors that don't decode."""
+        if v is not None:
+            cls.decode_cursor(v)
+        return v
+    
+    @staticmethod
+    def encode_cursor(created_at: datetime, row_id: int) -> str:
+        """
+        Build the cursor pointing just past a row.
+        
+        Args:
+            created_at: The row's created_at
+            row_id: The row's id
+        
+        Returns:
+            str: URL-safe cursor token
+        """
+        raw = f"{created_at.isoformat()}|{row_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        Split a cursor back into (created_at, id).
+        
+        Args:
+            cursor: Token produced by encode_cursor
+        
+        Returns:
+            tuple: (created_at, id)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(row_id)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError('Invalid pagination cursor') from e
+    
+    def decoded(self) -> Optional[Tuple[datetime, int]]:
+        """Get the (created_at, id) key of the cursor, or None on the first page."""
+        return self.decode_cursor(self.after) if self.after else None
+
+
+ItemT = TypeVar("ItemT", bound=BaseModel)
+
+
+class PaginatedResponse(BaseModel, Generic[ItemT]):
+    """
+    Schema for paginated responses.
+    
+    Parametrize with the item schema (e.g. PaginatedResponse[CampaignSummary])
+    so items are validated and serialized with that schema directly.
+    """
+    items: List[ItemT]
     total: int
     page: int
     size: int
@@ -295,26 +431,14 @@ class EmailTemplateBase(BaseModel):
     message: str = Field(..., min_length=1, description="Email message template")
     variables: Optional[str] = Field(None, description="Comma-separated list of template variables")
     
-    @validator('name')
-    def validate_name(cls, v):
-        """Validate template name."""
-        if not v.strip():
-            raise ValueError('Template name cannot be empty')
-        return v.strip()
-    
-    @validator('subject')
-    def validate_subject(cls, v):
-        """Validate template subject."""
-        if not v.strip():
-            raise ValueError('Template subject cannot be empty')
-        return v.strip()
-    
-    @validator('message')
-    def validate_message(cls, v):
-        """Validate template message."""
-        if not v.strip():
-            raise ValueError('Template message cannot be empty')
-        return v.strip()
+    @field_validator('name', 'subject', 'message', mode='after')
+    @classmethod
+    def validate_not_blank(cls, v, info: ValidationInfo):
+        """Strip template text fields and reject blank ones."""
+        v = v.strip()
+        if not v:
+            raise ValueError(f'Template {info.field_name} cannot be empty')
+        return v
 
 
 class EmailTemplateCreate(EmailTemplateBase):
@@ -333,19 +457,24 @@ class EmailTemplateUpdate(BaseModel):
 
 class EmailTemplateResponse(EmailTemplateBase):
     """Schema for email template response."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
     
     id: int
     created_at: datetime
     updated_at: datetime
     
-    # Computed field
-    variables_list: Optional[List[str]] = None
+    # Computed field (derived from variables, so the response can be built
+    # directly from the ORM object with model_validate)
+    @computed_field
+    @property
+    def variables_list(self) -> List[str]:
+        """Template variables as a list."""
+        return list(split_template_variables(self.variables))
 
 
 class EmailTemplateSummary(BaseModel):
     """Schema for email template summary (list view)."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
     
     id: int
     name: str
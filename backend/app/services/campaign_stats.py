@@ -0,0 +1,145 @@
+"""
+Batched campaign statistics for Email Campaign App.
+
+Cloud Tasks deliver one email per request. Rather than recounting every
+EmailSend row of the campaign after each one, send outcomes are tallied in
+memory and applied as one incremental UPDATE per campaign.
+"""
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import Update, and_, case, func, literal, update
+
+from app.database import session_scope
+from app.models import Campaign, CampaignStatus
+
+logger = logging.getLogger(__name__)
+
+# Recorded outcomes (across all campaigns) that trigger an immediate flush;
+# the rest go out with the periodic flush
+CAMPAIGN_STATS_BATCH_SIZE = int(os.getenv("CAMPAIGN_STATS_BATCH_SIZE", "25"))
+
+
+def campaign_counts_update(campaign_id: int, sent: int, failed: int) -> Update:
+    """
+    Build the UPDATE that counts sent/failed emails against a campaign.
+    
+    The counters are adjusted relative to their stored values, and a sending
+    campaign with nothing left pending is marked completed in the same
+    statement.
+    
+    Args:
+        campaign_id: Campaign to update
+        sent: Emails to count as sent
+        failed: Emails to count as failed
+        
+    Returns:
+        Update: The UPDATE statement
+    """
+    remaining = Campaign.emails_pending - (sent + failed)
+    finished = and_(remaining <= 0, Campaign.status == CampaignStatus.SENDING)
+    
+    return (
+        update(Campaign)
+        .where(Campaign.id == campaign_id)
+        .values(
+            emails_sent=Campaign.emails_sent + sent,
+            emails_failed=Campaign.emails_failed + failed,
+            emails_pending=remaining,
+            status=case(
+                (finished, literal(CampaignStatus.COMPLETED, Campaign.status.type)),
+                else_=Campaign.status
+            ),
+            completed_at=case((finished, func.now()), else_=Campaign.completed_at)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+class CampaignStatsBuffer:
+    """
+    Collects per-campaign sent/failed counts and writes them in batches.
+    
+    Each flush is a single UPDATE per campaign that adjusts the counters and,
+    once nothing is pending, marks a sending campaign as completed in the same
+    statement. Counts are flushed when batch_size outcomes are queued, or by
+    calling flush_all() periodically and at shutdown.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = CAMPAIGN_STATS_BATCH_SIZE,
+        on_flush: Optional[Callable[[int], None]] = None
+    ):
+        """
+        Initialize the buffer.
+        
+        Args:
+            batch_size: Queued outcomes that trigger an immediate flush
+            on_flush: Called with the campaign ID after its counts are written
+        """
+        self.batch_size = max(1, batch_size)
+        self.on_flush = on_flush
+        self._pending: Dict[int, Dict[str, int]] = defaultdict(lambda: {"sent": 0, "failed": 0})
+        self._queued = 0
+        self._lock = threading.Lock()
+    
+    def record(self, campaign_id: int, sent: bool):
+        """
+        Queue the outcome of one email send.
+        
+        Args:
+            campaign_id: Campaign the email belongs to
+            sent: True if the email was sent, False if it failed
+        """
+        with self._lock:
+            self._pending[campaign_id]["sent" if sent else "failed"] += 1
+            self._queued += 1
+            ready = self._queued >= self.batch_size
+        
+        if ready:
+            self.flush_all()
+    
+    def pending_count(self) -> int:
+        """Get the number of queued outcomes across all campaigns."""
+        with self._lock:
+            return self._queued
+    
+    def flush_all(self):
+        """Apply all queued counts, one UPDATE per campaign."""
+        with self._lock:
+            batch = dict(self._pending)
+            self._pending.clear()
+            self._queued = 0
+        
+        for campaign_id, counts in batch.items():
+            self._flush(campaign_id, counts["sent"], counts["failed"])
+    
+    def _flush(self, campaign_id: int, sent: int, failed: int):
+        """Apply queued counts to one campaign."""
+        try:
+            with session_scope() as db:
+                row = db.execute(
+                    campaign_counts_update(campaign_id, sent, failed)
+                    .returning(Campaign.name, Campaign.status, Campaign.emails_pending)
+                ).first()
+        except Exception as e:
+            logger.warning("⚠️  Could not update statistics for campaign %s: %s", campaign_id, e)
+            # Keep the counts so the next flush retries them
+            with self._lock:
+                self._pending[campaign_id]["sent"] += sent
+                self._pending[campaign_id]["failed"] += failed
+                self._queued += sent + failed
+            return
+        
+        if row is None:
+            return
+        if self.on_flush:
+            self.on_flush(campaign_id)
+        if row.status == CampaignStatus.COMPLETED and row.emails_pending <= 0:
+            logger.info("🎉 Campaign %s (%s) completed!", campaign_id, row.name)
+        logger.debug("📊 Updated statistics for campaign %s", campaign_id)
@@ -5,35 +5,48 @@ Provides functionality to send emails via SMTP (SpaceMail) with personalization,
 connection testing, and comprehensive error handling.
 """
 
+import itertools
 import os
+import queue
+import random
 import re
+import secrets
 import smtplib
+import time
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr, parseaddr
 import asyncio
+from functools import lru_cache
 import aiosmtplib
 from email_validator import validate_email, EmailNotValidError
-from jinja2 import Template
+from jinja2 import Environment, Template
 from dotenv import load_dotenv
 
+from app.utils.email_address import is_email_shaped
+from app.utils.token_bucket import TokenBucket
+
 # Load environment variables
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailAddress:
-    """Represents an email address with optional name."""
+    """Represents an email address with optional name (immutable, so it can be shared)."""
     email: str
     name: Optional[str] = None
+    # Header form of the address, formatted once at construction
+    _formatted: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        formatted = formataddr((self.name, self.email)) if self.name else self.email
+        object.__setattr__(self, '_formatted', formatted)
     
     def __str__(self) -> str:
-        if self.name:
-            return formataddr((self.name, self.email))
-        return self.email
+        return self._formatted
     
     @classmethod
     def from_string(cls, email_string: str) -> 'EmailAddress':
@@ -42,7 +55,7 @@ class EmailAddress:
         return cls(email=email, name=name if name else None)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage:
     """Represents an email message."""
     to: EmailAddress
@@ -53,7 +66,7 @@ class EmailMessage:
     additional_headers: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailResult:
     """Represents the result of sending an email."""
     success: bool
@@ -91,6 +104,72 @@ class EmailValidationError(EmailServiceError):
     pass
 
 
+# Message IDs are a random per-process prefix plus a counter: unique across
+# workers and restarts without hashing anything per send
+_MESSAGE_ID_PREFIX = secrets.token_hex(4)
+_message_id_counter = itertools.count()
+
+
+def _next_message_id(kind: str) -> str:
+    """Get a new opaque message ID, e.g. "email_3fa9c2d1_2a"."""
+    return f"{kind}_{_MESSAGE_ID_PREFIX}_{next(_message_id_counter):x}"
+
+
+# Shared environment for personalization templates (same settings as a bare
+# jinja2.Template). from_string bypasses the environment's template cache;
+# _compile_template's lru_cache is what compiles each source only once
+_TEMPLATE_ENV = Environment(autoescape=False, auto_reload=False)
+
+# Delimiters that make a template Jinja rather than str.format
+_JINJA_MARKERS = ('{{', '{%', '{#')
+
+
+@lru_cache(maxsize=256)
+def _compile_template(source: str) -> Template:
+    """Compile a Jinja2 personalization template once per distinct source."""
+    return _TEMPLATE_ENV.from_string(source)
+
+
+class _SafeDict(dict):
+    """str.format_map context that leaves unknown placeholders as written."""
+    
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+@lru_cache(maxsize=10000)
+def _is_valid_email_syntax(email: str) -> bool:
+    """
+    Full email_validator syntax check, memoized per address.
+    
+    Deliverability (DNS) isn't checked: recipients were already checked that
+    way when imported from the sheet, and a lookup per send is pure latency.
+    """
+    try:
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
+
+
+# How send failures are reported: (smtplib and aiosmtplib exception types,
+# error code, description), most specific first
+SMTP_ERROR_CODES: List[Tuple[Tuple[type, ...], str, str]] = [
+    ((smtplib.SMTPAuthenticationError, aiosmtplib.SMTPAuthenticationError), "AUTH_FAILED", "SMTP authentication failed"),
+    (
+        (smtplib.SMTPRecipientsRefused, aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPRecipientRefused),
+        "RECIPIENT_REFUSED", "Recipient refused"
+    ),
+    ((smtplib.SMTPSenderRefused, aiosmtplib.SMTPSenderRefused), "SENDER_REFUSED", "Sender refused"),
+    ((smtplib.SMTPDataError, aiosmtplib.SMTPDataError), "DATA_ERROR", "SMTP data error"),
+    ((smtplib.SMTPConnectError, aiosmtplib.SMTPConnectError), "CONNECTION_FAILED", "SMTP connection failed"),
+    ((smtplib.SMTPException, aiosmtplib.SMTPException), "SMTP_ERROR", "SMTP error"),
+]
+
+# Failures that retrying won't fix
+NON_RETRYABLE_ERROR_CODES = frozenset({"AUTH_FAILED", "SENDER_REFUSED", "RECIPIENT_REFUSED"})
+
+
 class EmailService:
     """
     Email service class for sending emails via SMTP.
@@ -136,15 +215,32 @@ class EmailService:
         # Default sender configuration
         self.default_from_email = default_from_email or os.getenv('DEFAULT_FROM_EMAIL', '')
         self.default_from_name = default_from_name or os.getenv('DEFAULT_FROM_NAME', '')
+        # Built once and shared by every message sent from the default sender
+        self.default_from_address = (
+            EmailAddress(email=self.default_from_email, name=self.default_from_name)
+            if self.default_from_email else None
+        )
         
         # Email settings
         self.mock_mode = mock_mode if mock_mode is not None else os.getenv('MOCK_EMAIL_SENDING', 'false').lower() == 'true'
         self.rate_limit = int(os.getenv('EMAIL_RATE_LIMIT', '60'))  # emails per minute
+        # Enforces rate_limit per process, allowing a burst of up to a minute's
+        # worth of sends; 0 disables it
+        self._rate_limiter = TokenBucket(self.rate_limit / 60.0, self.rate_limit) if self.rate_limit > 0 else None
         self.max_retry_attempts = int(os.getenv('EMAIL_RETRY_ATTEMPTS', '3'))
         self.retry_delay = int(os.getenv('EMAIL_RETRY_DELAY_SECONDS', '300'))  # 5 minutes
         
-        # Connection pool for async operations
-        self._connection_pool = None
+        # Idle authenticated SMTP connections, reused across send_email calls,
+        # each stored with the monotonic time it went idle
+        self.pool_size = max(1, int(os.getenv('SMTP_POOL_SIZE', '2')))
+        self._connection_pool: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue(maxsize=self.pool_size)
+        # Connections idle longer than this are closed instead of reused; most
+        # servers drop idle clients after a few minutes, and sends are often
+        # spaced minutes apart
+        self.pool_max_idle = float(os.getenv('SMTP_POOL_MAX_IDLE_SECONDS', '60'))
+        # The same for send_email_async; only touched from the event loop, so
+        # a plain list is enough
+        self._async_connection_pool: List[Tuple[aiosmtplib.SMTP, float]] = []
         
         # Validate configuration
         self._validate_configuration()
@@ -166,7 +262,7 @@ class EmailService:
         # Validate default from email format
         if self.default_from_email:
             try:
-                validate_email(self.default_from_email)
+                validate_email(self.default_from_email, check_deliverability=False)
             except EmailNotValidError as e:
                 raise EmailValidationError(f"Invalid default from email: {e}")
     
@@ -185,17 +281,8 @@ class EmailService:
             return True
         
         try:
-            # Create SMTP connection
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
-                if self.use_tls:
-                    server.starttls()
-            
-            # Test authentication
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
+            # Create and authenticate SMTP connection
+            server = self._open_connection()
             
             # Test connection
             server.noop()
@@ -214,6 +301,124 @@ class EmailService:
         except Exception as e:
             raise EmailConnectionError(f"Unexpected connection error: {e}")
     
+    def _open_connection(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+            if self.use_tls:
+                server.starttls()
+        
+        if self.smtp_username and self.smtp_password:
+            server.login(self.smtp_username, self.smtp_password)
+        
+        return server
+    
+    def _acquire_connection(self) -> smtplib.SMTP:
+        """
+        Take an idle pooled connection, or open a new one if none is usable.
+        
+        Pooled connections are checked with a NOOP before any transaction is
+        started on them, so a connection the server dropped while idle (an
+        SMTP error or a reset/broken socket) is replaced up front. Once a
+        message is under way it's never resent, since the server may already
+        have accepted it.
+        """
+        while True:
+            try:
+                server, idle_since = self._connection_pool.get_nowait()
+            except queue.Empty:
+                return self._open_connection()
+            if time.monotonic() - idle_since <= self.pool_max_idle:
+                try:
+                    server.noop()
+                    return server
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_connection(server)
+    
+    def _release_connection(self, server: smtplib.SMTP):
+        """Return a healthy connection to the pool (closing it if the pool is full)."""
+        try:
+            self._connection_pool.put_nowait((server, time.monotonic()))
+        except queue.Full:
+            self._close_connection(server)
+    
+    @staticmethod
+    def _close_connection(server: smtplib.SMTP):
+        """Close a connection, ignoring errors from an already-dropped socket."""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def warm_up(self):
+        """Open one pooled connection ahead of the first send (no-op in mock mode)."""
+        if self.mock_mode:
+            return
+        self._release_connection(self._open_connection())
+    
+    async def _open_async_connection(self) -> aiosmtplib.SMTP:
+        """Open and authenticate a new aiosmtplib connection."""
+        client = aiosmtplib.SMTP(
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            use_tls=self.use_ssl,
+            start_tls=self.use_tls and not self.use_ssl,
+            timeout=30
+        )
+        await client.connect()
+        if self.smtp_username and self.smtp_password:
+            await client.login(self.smtp_username, self.smtp_password)
+        return client
+    
+    async def _acquire_async_connection(self) -> aiosmtplib.SMTP:
+        """Take an idle pooled async connection (checked with a NOOP), or open a new one."""
+        while self._async_connection_pool:
+            client, idle_since = self._async_connection_pool.pop()
+            if time.monotonic() - idle_since <= self.pool_max_idle and client.is_connected:
+                try:
+                    await client.noop()
+                    return client
+                except (aiosmtplib.SMTPException, OSError):
+                    pass
+            await self._close_async_connection(client)
+        return await self._open_async_connection()
+    
+    async def _release_async_connection(self, client: aiosmtplib.SMTP):
+        """Return a healthy async connection to the pool (closing it if the pool is full)."""
+        if len(self._async_connection_pool) < self.pool_size:
+            self._async_connection_pool.append((client, time.monotonic()))
+        else:
+            await self._close_async_connection(client)
+    
+    @staticmethod
+    async def _close_async_connection(client: aiosmtplib.SMTP):
+        """Close an async connection, ignoring errors from an already-dropped socket."""
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+    
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                server, _ = self._connection_pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close_connection(server)
+        
+        # Async clients can't be QUIT outside their event loop; drop the sockets
+        # (if that loop is already closed, its sockets are gone with it)
+        while self._async_connection_pool:
+            client, _ = self._async_connection_pool.pop()
+            try:
+                client.close()
+            except RuntimeError:
+                pass
+    
     def validate_email_address(self, email: str) -> bool:
         """
         Validate email address format.
@@ -224,11 +429,8 @@ class EmailService:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            validate_email(email)
-            return True
-        except EmailNotValidError:
-            return False
+        # Cheap shape check first; only plausible addresses get the full parse
+        return is_email_shaped(email) and _is_valid_email_syntax(email)
     
     def personalize_message(self, template: str, recipient_name: Optional[str] = None, **kwargs) -> str:
         """
@@ -242,6 +444,10 @@ class EmailService:
         Returns:
             Personalized message
         """
+        # Static text (e.g. a plain subject line) has nothing to substitute
+        if '{' not in template:
+            return template
+        
         try:
             # Create template context
             context = {
@@ -250,22 +456,15 @@ class EmailService:
                 **kwargs
             }
             
-            # Use Jinja2 for advanced templating
-            jinja_template = Template(template)
-            personalized = jinja_template.render(**context)
+            # Use Jinja2 for advanced templating (expressions, tags or
+            # comments), compiled once per distinct subject/body rather than
+            # once per recipient
+            if any(marker in template for marker in _JINJA_MARKERS):
+                return _compile_template(template).render(**context)
             
-            # Fallback to simple string formatting for basic placeholders
-            if '{{' not in template and '{' in template:
-                try:
-                    personalized = template.format(**context)
-                except KeyError:
-                    # If some keys are missing, use partial formatting
-                    for key, value in context.items():
-                        placeholder = '{' + key + '}'
-                        if placeholder in template:
-                            personalized = personalized.replace(placeholder, str(value))
-            
-            return personalized
+            # Simple string formatting for basic placeholders; missing keys
+            # are left in place
+            return template.format_map(_SafeDict(context))
             
         except Exception as e:
             # If personalization fails, return original template
@@ -317,150 +516,128 @@ class EmailService:
         personalized_subject = self.personalize_message(subject, to_name, **template_vars)
         personalized_body = self.personalize_message(body, to_name, **template_vars)
         
+        if from_email == self.default_from_email and from_name == self.default_from_name:
+            from_address = self.default_from_address
+        else:
+            from_address = EmailAddress(email=from_email, name=from_name) if from_email else None
+        
         return EmailMessage(
             to=EmailAddress(email=to_email, name=to_name),
             subject=personalized_subject,
             body=personalized_body,
-            from_email=EmailAddress(email=from_email, name=from_name) if from_email else None,
+            from_email=from_address,
             reply_to=EmailAddress.from_string(reply_to) if reply_to else None
         )
     
-    def send_email(self, message: EmailMessage, retry_count: int = 0) -> EmailResult:
+    def _rate_limit_wait(self) -> float:
+        """Take a send from the rate limiter; returns the seconds to wait first."""
+        return self._rate_limiter.acquire() if self._rate_limiter else 0.0
+    
+    def reserve_send(self) -> float:
+        """
+        Take a send from the rate limiter ahead of send_email.
+        
+        Lets async callers wait without holding a worker thread; pass
+        rate_limited=True to the send_email call that uses the reservation.
+        
+        Returns:
+            Seconds to wait before sending (0 in mock mode)
+        """
+        return 0.0 if self.mock_mode else self._rate_limit_wait()
+    
+    def _build_mime(self, message: EmailMessage) -> MIMEText:
+        """Build the MIME message to send for an EmailMessage."""
+        mime_msg = MIMEText(message.body, 'plain', 'utf-8')
+        mime_msg['Subject'] = message.subject
+        mime_msg['From'] = str(message.from_email) if message.from_email else self.default_from_email
+        mime_msg['To'] = str(message.to)
+        
+        if message.reply_to:
+            mime_msg['Reply-To'] = str(message.reply_to)
+        
+        # Add additional headers
+        if message.additional_headers:
+            for key, value in message.additional_headers.items():
+                mime_msg[key] = value
+        
+        return mime_msg
+    
+    @staticmethod
+    def _sent_result(message: EmailMessage, smtp_response: Any, retry_count: int = 0) -> EmailResult:
+        """Build the EmailResult for a message the server accepted."""
+        return EmailResult(
+            success=True,
+            recipient=message.to.email,
+            message_id=_next_message_id("email"),
+            smtp_response=str(smtp_response) if smtp_response else "250 OK",
+            sent_at=datetime.utcnow(),
+            retry_count=retry_count
+        )
+    
+    @staticmethod
+    def _error_result(message: EmailMessage, error: Exception, retry_count: int = 0) -> EmailResult:
+        """Build the EmailResult for a failed send, classifying the error."""
+        for error_types, error_code, description in SMTP_ERROR_CODES:
+            if isinstance(error, error_types):
+                break
+        else:
+            error_code, description = "UNKNOWN_ERROR", "Unexpected error"
+        
+        return EmailResult(
+            success=False,
+            recipient=message.to.email,
+            error_message=f"{description}: {error}",
+            error_code=error_code,
+            retry_count=retry_count
+        )
+    
+    def send_email(self, message: EmailMessage, retry_count: int = 0, rate_limited: bool = False) -> EmailResult:
         """
         Send a single email message.
         
         Args:
             message: EmailMessage to send
             retry_count: Current retry attempt
+            rate_limited: True if the caller already waited out reserve_send()
             
         Returns:
             EmailResult with send status and details
         """
-        start_time = datetime.utcnow()
-        
         # Mock mode for testing
         if self.mock_mode:
             return EmailResult(
                 success=True,
                 recipient=message.to.email,
-                message_id=f"mock_{int(start_time.timestamp())}",
+                message_id=_next_message_id("mock"),
                 smtp_response="250 OK (Mock Mode)",
-                sent_at=start_time,
+                sent_at=datetime.utcnow(),
                 retry_count=retry_count
             )
         
+        wait = 0.0 if rate_limited else self._rate_limit_wait()
+        if wait > 0:
+            time.sleep(wait)
+        
+        server = None
         try:
-            # Create SMTP connection
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
-                if self.use_tls:
-                    server.starttls()
-            
-            # Authenticate
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
-            
-            # Create MIME message
-            mime_msg = MIMEText(message.body, 'plain', 'utf-8')
-            mime_msg['Subject'] = message.subject
-            mime_msg['From'] = str(message.from_email) if message.from_email else self.default_from_email
-            mime_msg['To'] = str(message.to)
-            
-            if message.reply_to:
-                mime_msg['Reply-To'] = str(message.reply_to)
-            
-            # Add additional headers
-            if message.additional_headers:
-                for key, value in message.additional_headers.items():
-                    mime_msg[key] = value
-            
-            # Send email
-            smtp_response = server.send_message(mime_msg)
-            server.quit()
-            
-            # Extract message ID from response if available
-            message_id = f"email_{int(start_time.timestamp())}_{hash(message.to.email)}"
-            
-            return EmailResult(
-                success=True,
-                recipient=message.to.email,
-                message_id=message_id,
-                smtp_response=str(smtp_response) if smtp_response else "250 OK",
-                sent_at=datetime.utcnow(),
-                retry_count=retry_count
-            )
+            mime_msg = self._build_mime(message)
             
-        except smtplib.SMTPAuthenticationError as e:
-            error_msg = f"SMTP authentication failed: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="AUTH_FAILED",
-                retry_count=retry_count
-            )
-            
-        except smtplib.SMTPRecipientsRefused as e:
-            error_msg = f"Recipient refused: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="RECIPIENT_REFUSED",
-                retry_count=retry_count
-            )
-            
-        except smtplib.SMTPSenderRefused as e:
-            error_msg = f"Sender refused: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="SENDER_REFUSED",
-                retry_count=retry_count
-            )
-            
-        except smtplib.SMTPDataError as e:
-            error_msg = f"SMTP data error: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="DATA_ERROR",
-                retry_count=retry_count
-            )
+            # Send email over a pooled connection (checked before use)
+            server = self._acquire_connection()
+            smtp_response = server.send_message(mime_msg)
             
-        except smtplib.SMTPConnectError as e:
-            error_msg = f"SMTP connection failed: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="CONNECTION_FAILED",
-                retry_count=retry_count
-            )
+            self._release_connection(server)
+            server = None
             
-        except smtplib.SMTPException as e:
-            error_msg = f"SMTP error: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="SMTP_ERROR",
-                retry_count=retry_count
-            )
+            return self._sent_result(message, smtp_response, retry_count)
             
         except Exception as e:
-            error_msg = f"Unexpected error: {e}"
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=error_msg,
-                error_code="UNKNOWN_ERROR",
-                retry_count=retry_count
-            )
+            return self._error_result(message, e, retry_count)
+        
+        finally:
+            # Don't return a connection in an unknown state to the pool
+            if server is not None:
+                self._close_connection(server)
     
     def send_email_with_retry(self, message: EmailMessage) -> EmailResult:
         """
@@ -483,7 +660,7 @@ class EmailService:
             last_result = result
             
             # Don't retry for certain error types
-            if result.error_code in ['AUTH_FAILED', 'SENDER_REFUSED', 'RECIPIENT_REFUSED']:
+            if result.error_code in NON_RETRYABLE_ERROR_CODES:
                 break
             
             # Wait before retry (except on last attempt)
@@ -498,8 +675,6 @@ class EmailService:
             error_code="MAX_RETRIES_EXCEEDED"
         )
     
-
-    
     async def send_email_async(self, message: EmailMessage) -> EmailResult:
         """
         Send email asynchronously using aiosmtplib.
@@ -510,56 +685,111 @@ class EmailService:
         Returns:
             EmailResult with send status
         """
-        start_time = datetime.utcnow()
-        
         # Mock mode for testing
         if self.mock_mode:
             return EmailResult(
                 success=True,
                 recipient=message.to.email,
-                message_id=f"async_mock_{int(start_time.timestamp())}",
+                message_id=_next_message_id("async_mock"),
                 smtp_response="250 OK (Async Mock Mode)",
-                sent_at=start_time
+                sent_at=datetime.utcnow()
             )
         
+        wait = self._rate_limit_wait()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        client = None
         try:
-            # Create MIME message
-            mime_msg = MIMEText(message.body, 'plain', 'utf-8')
-            mime_msg['Subject'] = message.subject
-            mime_msg['From'] = str(message.from_email) if message.from_email else self.default_from_email
-            mime_msg['To'] = str(message.to)
-            
-            if message.reply_to:
-                mime_msg['Reply-To'] = str(message.reply_to)
-            
-            # Send via aiosmtplib
-            await aiosmtplib.send(
-                mime_msg,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_username,
-                password=self.smtp_password,
-                use_tls=self.use_tls,
-                start_tls=self.use_tls and not self.use_ssl
-            )
+            mime_msg = self._build_mime(message)
+            
+            # Send via a pooled aiosmtplib connection (checked before use)
+            client = await self._acquire_async_connection()
+            _, smtp_response = await client.send_message(mime_msg)
             
-            message_id = f"async_email_{int(start_time.timestamp())}_{hash(message.to.email)}"
+            await self._release_async_connection(client)
+            client = None
             
             return EmailResult(
                 success=True,
                 recipient=message.to.email,
-                message_id=message_id,
-                smtp_response="250 OK (Async)",
+                message_id=_next_message_id("async_email"),
+                smtp_response=smtp_response or "250 OK (Async)",
                 sent_at=datetime.utcnow()
             )
             
         except Exception as e:
-            return EmailResult(
-                success=False,
-                recipient=message.to.email,
-                error_message=f"Async send error: {e}",
-                error_code="ASYNC_SEND_ERROR"
-            )
+            return self._error_result(message, e)
+        
+        finally:
+            # Don't return a connection in an unknown state to the pool
+            if client is not None:
+                await self._close_async_connection(client)
+    
+    async def send_many_async(
+        self,
+        messages: List[EmailMessage],
+        concurrency: Optional[int] = None
+    ) -> List[EmailResult]:
+        """
+        Send several messages concurrently over separate SMTP sessions.
+        
+        Args:
+            messages: EmailMessages to send
+            concurrency: Maximum sends in flight; defaults to pool_size, so
+                every session is kept warm in the pool between calls
+            
+        Returns:
+            One EmailResult per message, in order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.pool_size))
+        
+        async def send_one(message: EmailMessage) -> EmailResult:
+            async with semaphore:
+                return await self.send_email_async(message)
+        
+        # send_email_async reports failures as results rather than raising
+        return await asyncio.gather(*(send_one(message) for message in messages))
+    
+    async def send_email_with_retry_async(self, message: EmailMessage) -> EmailResult:
+        """
+        Send email asynchronously with automatic retry on failure.
+        
+        Waits between attempts with exponential backoff (1s, 2s, 4s, ...
+        capped at retry_delay) plus up to a second of jitter, without
+        blocking the event loop.
+        
+        Args:
+            message: EmailMessage to send
+            
+        Returns:
+            EmailResult with final send status
+        """
+        last_result = None
+        
+        for attempt in range(self.max_retry_attempts):
+            result = await self.send_email_async(message)
+            result.retry_count = attempt
+            
+            if result.success:
+                return result
+            
+            last_result = result
+            
+            # Don't retry for certain error types
+            if result.error_code in NON_RETRYABLE_ERROR_CODES:
+                break
+            
+            # Wait before retry (except on last attempt)
+            if attempt < self.max_retry_attempts - 1:
+                await asyncio.sleep(min(self.retry_delay, 2 ** attempt) + random.uniform(0, 1))
+        
+        return last_result or EmailResult(
+            success=False,
+            recipient=message.to.email,
+            error_message="Failed after maximum retry attempts",
+            error_code="MAX_RETRIES_EXCEEDED"
+        )
     
     def get_connection_info(self) -> Dict[str, Any]:
         """
@@ -578,7 +808,11 @@ class EmailService:
             'mock_mode': self.mock_mode,
             'rate_limit': self.rate_limit,
             'max_retry_attempts': self.max_retry_attempts,
-            'retry_delay': self.retry_delay
+            'retry_delay': self.retry_delay,
+            'pool_size': self.pool_size,
+            'pool_max_idle_seconds': self.pool_max_idle,
+            'idle_connections': self._connection_pool.qsize(),
+            'idle_async_connections': len(self._async_connection_pool)
         }
     
     def health_check(self) -> Dict[str, Any]:
@@ -642,4 +876,38 @@ def send_simple_email(
         to_name=to_name,
         **template_vars
     )
-    return service.send_email_with_retry(message)
\ No newline at end of file
+    return service.send_email_with_retry(message)
+
+
+async def send_simple_email_async(
+    to_email: str,
+    subject: str,
+    body: str,
+    to_name: Optional[str] = None,
+    **template_vars
+) -> EmailResult:
+    """
+    Send a simple email with default configuration, without blocking the event loop.
+    
+    Args:
+        to_email: Recipient email
+        subject: Email subject
+        body: Email body
+        to_name: Recipient name
+        **template_vars: Template variables
+        
+    Returns:
+        EmailResult
+    """
+    service = create_email_service()
+    message = service.create_email_message(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        to_name=to_name,
+        **template_vars
+    )
+    try:
+        return await service.send_email_with_retry_async(message)
+    finally:
+        service.close()
\ No newline at end of file
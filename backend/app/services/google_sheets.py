@@ -8,7 +8,10 @@ validate sheet access, and mark emails as sent.
 import os
 import re
 import json
-from typing import List, Dict, Optional, Tuple, Any
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -20,9 +23,22 @@ from googleapiclient.errors import HttpError
 from email_validator import validate_email, EmailNotValidError
 from dotenv import load_dotenv
 
+from app.utils.ttl_cache import TTLCache
+from app.utils.email_address import is_email_shaped
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Seconds to reuse Sheets API results (Sheets allows ~100 requests per 100s per user)
+SHEETS_CACHE_TTL = int(os.getenv("SHEETS_CACHE_TTL", "30"))
+SHEETS_ACCESS_CACHE_TTL = int(os.getenv("SHEETS_ACCESS_CACHE_TTL", "300"))
+
+# Buffered "mark as sent" writes: flush a sheet once this many rows are queued
+# (the rest go out with the periodic flush)
+SHEETS_MARK_BATCH_SIZE = int(os.getenv("SHEETS_MARK_BATCH_SIZE", "50"))
+
 
 @dataclass
 class EmailRow:
@@ -111,6 +127,11 @@ class GoogleSheetsService:
         self._service = None
         self._credentials = None
         
+        # Short-lived caches for read-only API calls, invalidated per sheet
+        # when this service writes to it
+        self._access_cache = TTLCache(ttl=SHEETS_ACCESS_CACHE_TTL)
+        self._read_cache = TTLCache(ttl=SHEETS_CACHE_TTL)
+        
     def _get_credentials(self) -> Credentials:
         """
         Get Google service account credentials.
@@ -201,10 +222,16 @@ class GoogleSheetsService:
         Returns:
             True if accessible, False otherwise
         """
+        # Only successes are cached, so a sheet shared after a failed check
+        # is picked up on the next call
+        if self._access_cache.get(sheet_id):
+            return True
+        
         try:
             service = self._get_service()
             # Try to get sheet metadata
             service.spreadsheets().get(spreadsheetId=sheet_id).execute()
+            self._access_cache.set(sheet_id, True)
             return True
             
         except HttpError as e:
@@ -232,6 +259,13 @@ class GoogleSheetsService:
             GoogleSheetsAccessError: If sheet cannot be accessed
             GoogleSheetsValidationError: If sheet data is invalid
         """
+        return self._read_cache.get_or_set(
+            ("info", sheet_id, sheet_range),
+            lambda: self._fetch_sheet_info(sheet_id, sheet_range)
+        )
+    
+    def _fetch_sheet_info(self, sheet_id: str, sheet_range: str) -> SheetInfo:
+        """Fetch sheet metadata and email statistics (uncached get_sheet_info)."""
         if not self.validate_sheet_id(sheet_id):
             raise GoogleSheetsValidationError(f"Invalid Google Sheets ID format: {sheet_id}")
         
@@ -297,6 +331,26 @@ class GoogleSheetsService:
         Returns:
             List of EmailRow objects
             
+        Raises:
+            GoogleSheetsAccessError: If sheet cannot be accessed
+            GoogleSheetsValidationError: If sheet data is invalid
+        """
+        return list(self.iter_email_addresses(sheet_id, sheet_range))
+    
+    def iter_email_addresses(self, sheet_id: str, sheet_range: str = "A:Z") -> Iterator[EmailRow]:
+        """
+        Read email addresses from a Google Sheet, yielding one row at a time.
+        
+        The sheet is fetched in a single API call; EmailRow objects are built
+        lazily so callers can process and discard them as they go.
+        
+        Args:
+            sheet_id: Google Sheets ID
+            sheet_range: Range to read (default: A:Z)
+            
+        Yields:
+            EmailRow objects
+            
         Raises:
             GoogleSheetsAccessError: If sheet cannot be accessed
             GoogleSheetsValidationError: If sheet data is invalid
@@ -326,7 +380,7 @@ class GoogleSheetsService:
                     f"No email column found. Expected one of: {', '.join(self.EMAIL_COLUMN_NAMES)}"
                 )
             
-            email_rows = []
+            row_count = 0
             seen_emails = set()
             
             for row_index, row in enumerate(data_rows, start=2):  # Start at row 2 (skip header)
@@ -345,12 +399,18 @@ class GoogleSheetsService:
                 is_valid = True
                 validation_error = None
                 
-                try:
-                    validated_email = validate_email(email)
-                    email = validated_email.email  # Normalized email
-                except EmailNotValidError as e:
+                # Cheap shape check first; only plausible cells get the full
+                # email_validator parse
+                if not is_email_shaped(email):
                     is_valid = False
-                    validation_error = str(e)
+                    validation_error = "The email address is not valid."
+                else:
+                    try:
+                        validated_email = validate_email(email)
+                        email = validated_email.email  # Normalized email
+                    except EmailNotValidError as e:
+                        is_valid = False
+                        validation_error = str(e)
                 
                 # Check for duplicates
                 if email.lower() in seen_emails:
@@ -374,13 +434,12 @@ class GoogleSheetsService:
                     validation_error=validation_error
                 )
                 
-                email_rows.append(email_row)
+                row_count += 1
+                yield email_row
             
-            if not email_rows:
+            if not row_count:
                 raise GoogleSheetsValidationError("No email addresses found in sheet")
             
-            return email_rows
-            
         except HttpError as e:
             if e.resp.status == 404:
                 raise GoogleSheetsAccessError(f"Sheet not found: {sheet_id}")
@@ -466,6 +525,7 @@ class GoogleSheetsService:
                     body=batch_update_request
                 ).execute()
             
+            self.invalidate_cache(sheet_id)
             return True
             
         except HttpError as e:
@@ -478,6 +538,27 @@ class GoogleSheetsService:
         except Exception as e:
             raise GoogleSheetsAccessError(f"Unexpected error updating sheet: {e}")
     
+    def invalidate_cache(self, sheet_id: str):
+        """
+        Drop cached reads for a sheet.
+        
+        Args:
+            sheet_id: Google Sheets ID
+        """
+        self._read_cache.invalidate(lambda key: key[1] == sheet_id)
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hit/miss statistics for the Sheets API caches.
+        
+        Returns:
+            Dictionary of cache statistics by cache name
+        """
+        return {
+            'access': self._access_cache.stats(),
+            'reads': self._read_cache.stats()
+        }
+    
     def _detect_email_column(self, headers: List[str]) -> Optional[str]:
         """Detect email column from headers."""
         for header in headers:
@@ -519,6 +600,9 @@ class GoogleSheetsService:
             if email_column_index < len(row):
                 email = row[email_column_index].strip()
                 if email:
+                    if not is_email_shaped(email):
+                        invalid_count += 1
+                        continue
                     try:
                         validated_email = validate_email(email)
                         normalized_email = validated_email.email.lower()
@@ -583,6 +667,13 @@ class GoogleSheetsService:
         Returns:
             Dictionary with preview data
         """
+        return self._read_cache.get_or_set(
+            ("preview", sheet_id, sheet_range, max_rows),
+            lambda: self._fetch_preview_data(sheet_id, sheet_range, max_rows)
+        )
+    
+    def _fetch_preview_data(self, sheet_id: str, sheet_range: str, max_rows: int) -> Dict:
+        """Fetch preview data (uncached get_preview_data)."""
         try:
             sheet_info = self.get_sheet_info(sheet_id, sheet_range)
             email_rows = self.read_email_addresses(sheet_id, sheet_range)
@@ -610,4 +701,90 @@ class GoogleSheetsService:
             }
             
         except Exception as e:
-            raise GoogleSheetsAccessError(f"Failed to get sheet preview: {e}")
\ No newline at end of file
+            raise GoogleSheetsAccessError(f"Failed to get sheet preview: {e}")
+
+
+class SheetUpdateBuffer:
+    """
+    Collects "mark as sent" updates and writes them to each sheet in batches.
+    
+    Each flush is a single mark_emails_as_sent() call (one values.batchUpdate)
+    per sheet instead of one call per email. Rows are flushed when a sheet
+    reaches batch_size queued rows, or by calling flush_all() periodically
+    and at shutdown.
+    """
+    
+    def __init__(
+        self,
+        sheets_service: GoogleSheetsService,
+        batch_size: int = SHEETS_MARK_BATCH_SIZE,
+        on_flushed: Optional[Callable[[List[int]], None]] = None
+    ):
+        """
+        Initialize the buffer.
+        
+        Args:
+            sheets_service: Service used to write to the sheets
+            batch_size: Queued rows per sheet that trigger an immediate flush
+            on_flushed: Called with the record IDs of rows written successfully
+        """
+        self.sheets_service = sheets_service
+        self.batch_size = max(1, batch_size)
+        self.on_flushed = on_flushed
+        self._pending: Dict[Tuple[str, str], List[Tuple[int, EmailRow]]] = defaultdict(list)
+        self._lock = threading.Lock()
+    
+    def add(self, sheet_id: str, record_id: int, email_row: EmailRow, status_column: Optional[str] = None):
+        """
+        Queue a row to be marked as sent.
+        
+        Args:
+            sheet_id: Google Sheets ID
+            record_id: ID of the record the row belongs to (passed to on_flushed)
+            email_row: Row to mark
+            status_column: Column name for status (default: 'Email Status')
+        """
+        key = (sheet_id, status_column or GoogleSheetsService.STATUS_COLUMN_NAME)
+        with self._lock:
+            self._pending[key].append((record_id, email_row))
+            ready = len(self._pending[key]) >= self.batch_size
+        
+        if ready:
+            self._flush(key)
+    
+    def pending_count(self) -> int:
+        """Get the number of queued rows across all sheets."""
+        with self._lock:
+            return sum(len(rows) for rows in self._pending.values())
+    
+    def flush_all(self):
+        """Write all queued rows, one batch per sheet."""
+        with self._lock:
+            keys = list(self._pending)
+        for key in keys:
+            self._flush(key)
+    
+    def _flush(self, key: Tuple[str, str]):
+        """Write the queued rows for one sheet/status column."""
+        with self._lock:
+            entries = self._pending.pop(key, [])
+        if not entries:
+            return
+        
+        sheet_id, status_column = key
+        try:
+            self.sheets_service.mark_emails_as_sent(
+                sheet_id,
+                [email_row for _, email_row in entries],
+                status_column=status_column
+            )
+            logger.info("✅ Marked %s emails as sent in Google Sheets", len(entries))
+        except Exception as e:
+            logger.warning("⚠️  Could not mark %s emails as sent in sheet %s: %s", len(entries), sheet_id, e)
+            return
+        
+        if self.on_flushed:
+            try:
+                self.on_flushed([record_id for record_id, _ in entries])
+            except Exception as e:
+                logger.warning("⚠️  Could not record sheet updates: %s", e)
@@ -8,6 +8,8 @@ sending, enabling scalable and resilient email campaign processing.
 import os
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from google.cloud import tasks_v2
@@ -20,6 +22,9 @@ load_dotenv()
 # Import business hours utilities
 from app.utils.business_hours import calculate_next_business_hour, is_within_business_hours
 
+# Concurrent create_task calls when enqueueing a campaign
+TASK_CREATE_CONCURRENCY = max(1, int(os.getenv('TASK_CREATE_CONCURRENCY', '10')))
+
 
 class CloudTasksService:
     """
@@ -130,7 +135,7 @@ class CloudTasksService:
         business_hours_end: int = 17,
         business_days_only: bool = True,
         timezone: str = "UTC"
-    ) -> list[Task]:
+    ) -> tuple[list[Task], list[int]]:
         """
         Create multiple email tasks for a campaign with staggered delays.
         
@@ -145,9 +150,10 @@ class CloudTasksService:
             timezone: Timezone string (e.g., "UTC", "US/Pacific")
             
         Returns:
-            List of created Task objects
+            Tuple of (created Task objects, EmailSend IDs whose task could not be created)
         """
         tasks = []
+        failed_ids = []
         current_schedule_time = datetime.utcnow()
         
         # Log scheduling approach
@@ -159,6 +165,9 @@ class CloudTasksService:
         else:
             print(f"🚀 Creating {len(email_send_ids)} email tasks with {delay_min_minutes}-{delay_max_minutes} minute delays (24/7 scheduling)")
         
+        # Work out every schedule time first; the delays chain, so this part
+        # is sequential, but it makes no API calls
+        planned = []
         for i, email_send_id in enumerate(email_send_ids):
             # Calculate next schedule time
             if i == 0:
@@ -196,28 +205,40 @@ class CloudTasksService:
             # Create task name to ensure uniqueness
             task_name = f"email-{email_send_id}-{int(datetime.utcnow().timestamp())}"
             
+            planned.append((email_send_id, delay_minutes, task_name))
+            
+            if i < 5 or (respect_business_hours and i % 5 == 0):  # Show more detail for business hours
+                scheduled_time = current_schedule_time.strftime('%Y-%m-%d %H:%M:%S')
+                print(f"   📧 Email {i+1} scheduled for: {scheduled_time} UTC (delay: {delay_minutes}m)")
+        
+        def create(plan) -> Optional[Task]:
+            email_send_id, delay_minutes, task_name = plan
             try:
-                task = self.create_email_task(
+                return self.create_email_task(
                     email_send_id=email_send_id,
                     delay_minutes=delay_minutes,
                     task_name=task_name
                 )
-                tasks.append(task)
-                
-                # Log progress and schedule time
-                if i % 10 == 0 and i > 0:
-                    print(f"📊 Created {i}/{len(email_send_ids)} tasks...")
-                elif i < 5 or (respect_business_hours and i % 5 == 0):  # Show more detail for business hours
-                    scheduled_time = current_schedule_time.strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"   📧 Email {i+1} scheduled for: {scheduled_time} UTC (delay: {delay_minutes}m)")
-                    
             except Exception as e:
                 print(f"❌ Failed to create task for email_send_id {email_send_id}: {e}")
                 # Continue creating other tasks
-                continue
+                return None
+        
+        # Enqueue concurrently; the client is thread-safe and each call is
+        # a network round trip
+        with ThreadPoolExecutor(max_workers=TASK_CREATE_CONCURRENCY) as executor:
+            for i, task in enumerate(executor.map(create, planned)):
+                if task is not None:
+                    tasks.append(task)
+                else:
+                    failed_ids.append(planned[i][0])
+                
+                # Log progress
+                if i % 10 == 0 and i > 0:
+                    print(f"📊 Created {i}/{len(email_send_ids)} tasks...")
         
         print(f"✅ Successfully created {len(tasks)}/{len(email_send_ids)} email tasks")
-        return tasks
+        return tasks, failed_ids
     
     def delete_task(self, task_name: str) -> bool:
         """
@@ -275,13 +296,13 @@ class CloudTasksService:
             return False
 
 
-# Global instance
-tasks_service: Optional[CloudTasksService] = None
-
-
+@lru_cache(maxsize=1)
 def get_tasks_service() -> CloudTasksService:
-    """Get or create the global Cloud Tasks service instance."""
-    global tasks_service
-    if tasks_service is None:
-        tasks_service = CloudTasksService()
-    return tasks_service
\ No newline at end of file
+    """
+    Get the process-wide Cloud Tasks service instance.
+    
+    The gRPC client is thread-safe, so one channel and set of credentials is
+    shared by all requests. A failed construction isn't cached and is retried
+    on the next call.
+    """
+    return CloudTasksService()
\ No newline at end of file
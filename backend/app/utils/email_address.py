@@ -0,0 +1,24 @@
+"""
+Email address shape check for Email Campaign App.
+
+A precompiled regex that cheaply rejects values that can't be an address
+(blank-ish text, missing "@" or domain). Full RFC/IDN validation is left to
+email_validator where an address first enters the app.
+"""
+
+import re
+
+EMAIL_SHAPE_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def is_email_shaped(value: str) -> bool:
+    """
+    Check that a value looks like an email address.
+    
+    Args:
+        value: Candidate address, already stripped
+    
+    Returns:
+        True if it has a local part, "@" and a dotted domain
+    """
+    return EMAIL_SHAPE_PATTERN.fullmatch(value) is not None
@@ -0,0 +1,61 @@
+"""
+Non-blocking logging setup for Email Campaign App.
+
+Request and task threads only put log records on a queue; a background
+listener thread does the formatting and the writes to stdout (or LOG_FILE).
+"""
+
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+LOG_FILE = os.getenv("LOG_FILE")
+
+_listener: Optional[QueueListener] = None
+
+
+def start_log_listener() -> QueueListener:
+    """
+    Route root logger output through a queue drained by a background thread.
+    
+    Safe to call more than once; later calls return the running listener.
+    
+    Returns:
+        QueueListener: The running listener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    if LOG_FILE:
+        os.makedirs(os.path.dirname(LOG_FILE) or ".", exist_ok=True)
+        output_handler = logging.FileHandler(LOG_FILE)
+    else:
+        output_handler = logging.StreamHandler()
+    output_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+    
+    _listener = QueueListener(log_queue, output_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_log_listener():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+    
+    _listener.stop()
+    for handler in list(logging.getLogger().handlers):
+        if isinstance(handler, QueueHandler):
+            logging.getLogger().removeHandler(handler)
+    _listener = None
@@ -0,0 +1,52 @@
+"""
+Token bucket rate limiter for Email Campaign App.
+
+Allows bursts up to the bucket's capacity and then a steady rate, with an
+O(1) check per call. Used to keep SMTP sends within the provider's limit.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    acquire() always takes its tokens, letting the balance go negative, and
+    returns how long the caller must wait for them. Concurrent callers are
+    therefore spaced out in order instead of all waking up at once.
+    """
+    
+    __slots__ = ("rate", "capacity", "tokens", "last", "_lock")
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (the burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Take tokens from the bucket.
+        
+        Args:
+            cost: Tokens to take
+        
+        Returns:
+            Seconds to wait before proceeding (0 if they were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= cost
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
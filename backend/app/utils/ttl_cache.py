@@ -0,0 +1,115 @@
+"""
+Small in-memory TTL cache for Email Campaign App.
+
+Used to avoid repeating external API calls (e.g. Google Sheets, which is
+rate limited per user) for data that is allowed to be a few seconds stale.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire after a fixed number of seconds.
+    
+    When full, the least recently written entry is evicted first.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int = 512):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return default
+    
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss.
+        
+        The factory runs outside the lock, so a slow call doesn't block other
+        keys; concurrent misses on the same key may both compute it.
+        
+        Args:
+            key: Cache key
+            factory: Callable producing the value on a miss
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        
+        value = factory()
+        self.set(key, value)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value under key."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: Hashable):
+        """Drop the entry for key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def invalidate(self, predicate: Callable[[Hashable], bool]):
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+    
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Entry count, hits, misses and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
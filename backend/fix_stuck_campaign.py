@@ -10,6 +10,8 @@ import os
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
+from sqlalchemy.orm import load_only
+
 from app.database import SessionLocal
 from app.models import Campaign, CampaignStatus
 from datetime import datetime
@@ -20,7 +22,11 @@ def fix_stuck_campaigns():
     
     try:
         # Find campaigns stuck in 'sending' status with no emails sent
-        stuck_campaigns = db.query(Campaign).filter(
+        # Load only the fields printed and reset here, not the message bodies
+        stuck_campaigns = db.query(Campaign).options(load_only(
+            Campaign.id, Campaign.name, Campaign.status, Campaign.started_at,
+            Campaign.emails_sent, Campaign.total_recipients
+        )).filter(
             Campaign.status == CampaignStatus.SENDING,
             Campaign.emails_sent == 0
         ).all()
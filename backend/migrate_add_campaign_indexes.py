@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Migration script to add composite indexes used by the list endpoints.
+
+Adds:
+- ix_campaigns_status_created_at: Lets the campaign list filter by status and
+  return the newest campaigns first without sorting the whole table
+- ix_campaigns_created_at_id: Serves the unfiltered campaign list and its
+  (created_at, id) keyset pagination
+- ix_email_sends_campaign_created_at_id: Lets the campaign email list page
+  through a campaign's sends by (created_at, id) keyset
+- ix_email_sends_campaign_status: Serves per-status counts and status filters
+  within a campaign
+
+Drops:
+- ix_email_sends_campaign_id: Redundant once the composite indexes above
+  (which all lead with campaign_id) exist; dropping it saves its upkeep on
+  every EmailSend insert
+- ix_campaigns_status, ix_campaigns_created_at: Prefixes of the composite
+  campaign indexes above
+"""
+
+import sqlite3
+import sys
+import os
+
+INDEXES = [
+    (
+        'campaigns',
+        'ix_campaigns_status_created_at',
+        'status, created_at DESC'
+    ),
+    (
+        'campaigns',
+        'ix_campaigns_created_at_id',
+        'created_at DESC, id DESC'
+    ),
+    (
+        'email_sends',
+        'ix_email_sends_campaign_created_at_id',
+        'campaign_id, created_at DESC, id DESC'
+    ),
+    (
+        'email_sends',
+        'ix_email_sends_campaign_status',
+        'campaign_id, status'
+    ),
+]
+
+REDUNDANT_INDEXES = [
+    ('email_sends', 'ix_email_sends_campaign_id'),
+    ('campaigns', 'ix_campaigns_status'),
+    ('campaigns', 'ix_campaigns_created_at'),
+]
+
+def migrate_database():
+    """Add composite list indexes to campaigns and email_sends, dropping superseded ones."""
+    
+    # Database path
+    db_path = os.path.join(os.path.dirname(__file__), 'email_campaigns.db')
+    
+    if not os.path.exists(db_path):
+        print(f"❌ Database file not found: {db_path}")
+        return False
+    
+    conn = None
+    try:
+        # Connect to database
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        created = set()
+        for table, index_name, columns in INDEXES:
+            print(f"🔍 Checking existing indexes on {table}...")
+            
+            # Check if index already exists
+            cursor.execute(f"PRAGMA index_list({table})")
+            indexes = [index[1] for index in cursor.fetchall()]
+            
+            if index_name in indexes:
+                print(f"✅ {index_name} index already exists")
+                continue
+            
+            print(f"📝 Creating {index_name} index...")
+            cursor.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+            created.add(table)
+        
+        for table, index_name in REDUNDANT_INDEXES:
+            cursor.execute(f"PRAGMA index_list({table})")
+            indexes = [index[1] for index in cursor.fetchall()]
+            
+            if index_name not in indexes:
+                continue
+            
+            print(f"🗑️  Dropping redundant {index_name} index...")
+            cursor.execute(f"DROP INDEX {index_name}")
+            created.add(table)
+        
+        if not created:
+            return True
+        
+        # Refresh planner statistics so the changed indexes get picked up
+        for table in created:
+            cursor.execute(f"ANALYZE {table}")
+        
+        # Commit changes
+        conn.commit()
+        
+        print("🎉 Migration completed successfully!")
+        
+        # Show the plans for the queries the indexes are meant to serve
+        query_plans = {
+            "Campaign list": """
+                SELECT id FROM campaigns 
+                WHERE status = 'SENDING' 
+                ORDER BY created_at DESC LIMIT 50
+            """,
+            "Unfiltered campaign list": """
+                SELECT id FROM campaigns 
+                ORDER BY created_at DESC, id DESC LIMIT 50
+            """,
+            "Campaign email list": """
+                SELECT id FROM email_sends 
+                WHERE campaign_id = 1 
+                ORDER BY created_at DESC, id DESC LIMIT 50
+            """,
+            "Campaign status count": """
+                SELECT count(*) FROM email_sends 
+                WHERE campaign_id = 1 AND status = 'PENDING'
+            """,
+        }
+        for label, query in query_plans.items():
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+            print(f"📋 {label} query plan:")
+            for row in cursor.fetchall():
+                print(f"   - {row[-1]}")
+        
+        return True
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+    finally:
+        if conn:
+            conn.close()
+
+if __name__ == "__main__":
+    print("🚀 Starting database migration for campaign list indexes...")
+    success = migrate_database()
+    sys.exit(0 if success else 1)
\ No newline at end of file
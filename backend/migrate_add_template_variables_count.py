@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the variables_count column to email_templates table.
+
+Adds:
+- variables_count: Integer column holding the number of names in variables
+  (default 0), backfilled for existing templates
+"""
+
+import sqlite3
+import sys
+import os
+
+def count_variables(variables):
+    """Count the non-empty names in a comma-separated variables string."""
+    if not variables:
+        return 0
+    return sum(1 for var in variables.split(',') if var.strip())
+
+def migrate_database():
+    """Add and backfill variables_count on email_templates table."""
+    
+    # Database path
+    db_path = os.path.join(os.path.dirname(__file__), 'email_campaigns.db')
+    
+    if not os.path.exists(db_path):
+        print(f"❌ Database file not found: {db_path}")
+        return False
+    
+    conn = None
+    try:
+        # Connect to database
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        print("🔍 Checking current table schema...")
+        
+        # Check if column already exists
+        cursor.execute("PRAGMA table_info(email_templates)")
+        columns = [column[1] for column in cursor.fetchall()]
+        
+        if not columns:
+            print("❌ email_templates table not found; run migrate_add_email_templates.py first")
+            return False
+        
+        if 'variables_count' in columns:
+            print("✅ variables_count column already exists in the database")
+            return True
+        
+        cursor.execute("ALTER TABLE email_templates ADD COLUMN variables_count INTEGER NOT NULL DEFAULT 0")
+        print("✅ Added variables_count column")
+        
+        # Backfill existing templates
+        cursor.execute("SELECT id, variables FROM email_templates WHERE variables IS NOT NULL")
+        counts = [(count_variables(variables), template_id) for template_id, variables in cursor.fetchall()]
+        cursor.executemany("UPDATE email_templates SET variables_count = ? WHERE id = ?", counts)
+        print(f"📝 Backfilled variables_count for {len(counts)} templates")
+        
+        # Commit changes
+        conn.commit()
+        
+        print("🎉 Migration completed successfully!")
+        return True
+    
+    except sqlite3.Error as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+    finally:
+        if conn:
+            conn.close()
+
+if __name__ == "__main__":
+    print("🚀 Starting database migration for template variable counts...")
+    success = migrate_database()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Migration script to switch large text columns to lz4 compression (PostgreSQL).
+
+Sets COMPRESSION lz4 on:
+- campaigns.message
+- email_templates.message
+- email_sends.personalized_message
+
+These bodies are stored out of line (TOAST) and compressed with pglz by
+default; lz4 decompresses several times faster whenever a row's body is read.
+Requires PostgreSQL 14+. Existing values keep their current compression until
+they are rewritten; new rows use lz4. SQLite databases are left unchanged.
+"""
+
+import sys
+
+from sqlalchemy import text
+
+from app.database import get_engine
+
+COMPRESSED_COLUMNS = [
+    ('campaigns', 'message'),
+    ('email_templates', 'message'),
+    ('email_sends', 'personalized_message'),
+]
+
+def migrate_database():
+    """Set lz4 compression on the large text columns."""
+    
+    engine = get_engine()
+    if engine.dialect.name != 'postgresql':
+        print(f"⏭️  {engine.dialect.name} database; column compression only applies to PostgreSQL")
+        return True
+    
+    try:
+        with engine.begin() as conn:
+            version = conn.execute(text("SHOW server_version_num")).scalar()
+            if int(version) < 140000:
+                print(f"⏭️  PostgreSQL {version} does not support column compression (14+ required)")
+                return True
+            
+            for table, column in COMPRESSED_COLUMNS:
+                conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4"))
+                print(f"✅ {table}.{column} now uses lz4 compression")
+        
+        print("🎉 Migration completed successfully!")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Database error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🚀 Starting database migration for text column compression...")
+    success = migrate_database()
+    sys.exit(0 if success else 1)
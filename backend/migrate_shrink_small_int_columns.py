@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Migration script to store small bounded counters as SMALLINT (PostgreSQL).
+
+Changes to SMALLINT:
+- campaigns: delay_min_minutes, delay_max_minutes, business_hours_start,
+  business_hours_end, error_count
+- email_sends: send_attempts, max_send_attempts
+
+Changing a column type rewrites the table under an exclusive lock, so run it
+when no campaign is sending. SQLite databases are left unchanged (SQLite
+stores integers by value, whatever the declared type).
+"""
+
+import sys
+
+from sqlalchemy import text
+
+from app.database import get_engine
+
+SMALLINT_COLUMNS = {
+    'campaigns': [
+        'delay_min_minutes', 'delay_max_minutes',
+        'business_hours_start', 'business_hours_end', 'error_count'
+    ],
+    'email_sends': ['send_attempts', 'max_send_attempts'],
+}
+
+def migrate_database():
+    """Change the bounded integer columns to SMALLINT."""
+    
+    engine = get_engine()
+    if engine.dialect.name != 'postgresql':
+        print(f"⏭️  {engine.dialect.name} database; nothing to change")
+        return True
+    
+    try:
+        with engine.begin() as conn:
+            for table, columns in SMALLINT_COLUMNS.items():
+                current = dict(conn.execute(
+                    text(
+                        "SELECT column_name, data_type FROM information_schema.columns "
+                        "WHERE table_name = :table"
+                    ),
+                    {"table": table}
+                ).all())
+                
+                to_change = [col for col in columns if current.get(col) not in (None, 'smallint')]
+                if not to_change:
+                    print(f"✅ {table} columns already use SMALLINT")
+                    continue
+                
+                # One ALTER per table so it is rewritten only once
+                alters = ", ".join(f"ALTER COLUMN {col} TYPE SMALLINT" for col in to_change)
+                conn.execute(text(f"ALTER TABLE {table} {alters}"))
+                print(f"✅ {table}: {', '.join(to_change)} now SMALLINT")
+        
+        print("🎉 Migration completed successfully!")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Database error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🚀 Starting database migration for SMALLINT columns...")
+    success = migrate_database()
+    sys.exit(0 if success else 1)
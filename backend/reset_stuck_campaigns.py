@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
+from sqlalchemy.orm import load_only
+
 from app.database import SessionLocal
 from app.models import Campaign, CampaignStatus
 
@@ -28,7 +30,11 @@ def reset_stuck_campaigns(max_age_minutes=30):
         cutoff_time = datetime.utcnow() - timedelta(minutes=max_age_minutes)
         
         # Find campaigns stuck in 'sending' status with no emails sent for more than max_age_minutes
-        stuck_campaigns = db.query(Campaign).filter(
+        # Load only the fields printed and reset here, not the message bodies
+        stuck_campaigns = db.query(Campaign).options(load_only(
+            Campaign.id, Campaign.name, Campaign.status, Campaign.started_at,
+            Campaign.emails_sent, Campaign.total_recipients
+        )).filter(
             Campaign.status == CampaignStatus.SENDING,
             Campaign.emails_sent == 0,
             Campaign.started_at < cutoff_time
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test script to verify email personalization templates.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("SMTP_USERNAME", "test@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "test")
+os.environ.setdefault("MOCK_EMAIL_SENDING", "true")
+
+from app.services.email_service import EmailService
+
+def test_jinja_tag_and_comment_templates():
+    """Templates using only {% %} or {# #} are rendered by Jinja."""
+    print("🧪 Testing Jinja tag and comment templates")
+    service = EmailService(default_from_email="sender@example.com")
+    
+    assert service.personalize_message(
+        "{% if company %}Dear team{% endif %}", "Ann Lee", company="Acme"
+    ) == "Dear team"
+    assert service.personalize_message("{# note #}Hello", "Ann Lee") == "Hello"
+    
+    print("   ✅ Tags and comments rendered")
+
+def test_format_templates():
+    """Single-brace placeholders are filled and unknown ones are kept."""
+    print("🧪 Testing str.format templates")
+    service = EmailService(default_from_email="sender@example.com")
+    
+    assert service.personalize_message("Hi {first_name}, {missing}", "Ann Lee") == "Hi Ann, {missing}"
+    assert service.personalize_message("Hi {{ first_name }}", "Ann Lee") == "Hi Ann"
+    assert service.personalize_message("Welcome!", "Ann Lee") == "Welcome!"
+    
+    print("   ✅ Placeholders filled")
+
+if __name__ == "__main__":
+    test_jinja_tag_and_comment_templates()
+    test_format_templates()
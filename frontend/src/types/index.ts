@@ -245,6 +245,7 @@ export interface EmailSendListParams extends PaginationParams {
   skip?: number;
   limit?: number;
   status_filter?: string;
+  after_id?: number;  // Keyset cursor: id of the last email on the previous page
 }
 
 // ============================================================================